@@ -13,7 +13,7 @@ import concurrent.futures
 from algebras.config import Config
 from algebras.services.file_scanner import FileScanner
 from algebras.commands import translate_command
-from algebras.utils.lang_validator import validate_language_files, find_outdated_keys
+from algebras.utils.lang_validator import validate_all_targets, find_outdated_keys
 from algebras.utils.git_utils import (
     is_git_available,
     is_git_repository,
@@ -86,6 +86,20 @@ def find_matching_source_file(lang_file: str, source_files: List[str], lang: str
     return None
 
 
+def validate_targets(source_file: str, target_files: List[str]) -> Dict[str, Tuple[bool, Set[str]]]:
+    """
+    Check target files for keys missing from their source file, reading the source file once.
+    
+    Args:
+        source_file: Path to the source language file
+        target_files: Paths to the target language files
+        
+    Returns:
+        Dictionary mapping each target file to its (is_valid, missing_keys) result
+    """
+    return dict(zip(target_files, validate_all_targets(source_file, target_files)))
+
+
 def identify_translation_issues(
     languages: List[str], 
     source_language: str, 
@@ -126,6 +140,15 @@ def identify_translation_issues(
     if check_git_outdated_keys and not git_available:
         click.echo(f"{Fore.YELLOW}Git is not available. Skipping detection of updated keys.\x1b[0m")
     
+    # Match every language file with its source file once; both processing
+    # paths below work from these matches
+    matched_files = {}  # Maps each language to (lang_file, source_file) pairs
+    for lang in languages:
+        matched_files[lang] = [
+            (lang_file, find_matching_source_file(lang_file, source_files, lang, source_language))
+            for lang_file in files_by_language.get(lang, [])
+        ]
+    
     if concurrent_processing:
         # Prepare batch processing of all file pairs
         all_file_pairs = []
@@ -142,9 +165,7 @@ def identify_translation_issues(
                 for lang_file in lang_files:
                     click.echo(f"  - {lang_file}")
             
-            for lang_file in lang_files:
-                source_file = find_matching_source_file(lang_file, source_files, lang, source_language)
-                
+            for lang_file, source_file in matched_files[lang]:
                 if verbose and source_file:
                     click.echo(f"{Fore.BLUE}Matched with source file: {source_file}\x1b[0m")
                 
@@ -152,6 +173,13 @@ def identify_translation_issues(
                     all_file_pairs.append((source_file, lang_file))
                     lang_file_map[(source_file, lang_file)] = lang
         
+        # Group the pairs that will be checked by source file, so each source
+        # file is read once for all of its targets
+        targets_by_source = {}
+        for src_file, tgt_file in all_file_pairs:
+            targets_by_source.setdefault(src_file, []).append(tgt_file)
+        validation_futures = {}
+        
         # Define check function
         def check_file_pair(pair):
             src_file, tgt_file = pair
@@ -171,8 +199,7 @@ def identify_translation_issues(
             
             # Check for missing keys
             if check_missing_keys:
-                # #endregion
-                is_valid, missing_keys = validate_language_files(src_file, tgt_file)
+                is_valid, missing_keys = validation_futures[src_file].result()[tgt_file]
                 if not is_valid:
                     results["missing_keys"] = missing_keys
             
@@ -190,6 +217,12 @@ def identify_translation_issues(
             
             # Use ThreadPoolExecutor for I/O bound operations
             with concurrent.futures.ThreadPoolExecutor() as executor:
+                # Submitted before the pair checks that wait on them, so each
+                # validation has started by the time a check needs its result
+                if check_missing_keys:
+                    for src_file, tgt_files in targets_by_source.items():
+                        validation_futures[src_file] = executor.submit(validate_targets, src_file, tgt_files)
+                
                 future_to_pair = {executor.submit(check_file_pair, pair): pair for pair in all_file_pairs}
                 
                 for future in concurrent.futures.as_completed(future_to_pair):
@@ -222,6 +255,13 @@ def identify_translation_issues(
     
     else:
         # Sequential processing
+        targets_by_source = {}
+        for lang in languages:
+            for lang_file, source_file in matched_files[lang]:
+                if source_file:
+                    targets_by_source.setdefault(source_file, []).append(lang_file)
+        missing_keys_by_source = {}  # Validation results, filled the first time a source is checked
+        
         for lang in languages:
             if verbose:
                 click.echo(f"\n{Fore.BLUE}Processing language: {lang}\x1b[0m")
@@ -237,12 +277,10 @@ def identify_translation_issues(
             missing_keys_files = []
             outdated_keys_files = []
             
-            for lang_file in lang_files:
+            for lang_file, source_file in matched_files[lang]:
                 if verbose:
                     click.echo(f"\n{Fore.BLUE}Analyzing file: {lang_file}\x1b[0m")
                 
-                source_file = find_matching_source_file(lang_file, source_files, lang, source_language)
-                
                 if verbose:
                     if source_file:
                         click.echo(f"{Fore.BLUE}Matched with source file: {source_file}\x1b[0m")
@@ -266,7 +304,11 @@ def identify_translation_issues(
                     if check_missing_keys:
                         if verbose:
                             click.echo(f"{Fore.BLUE}Validating language file for missing keys...\x1b[0m")
-                        is_valid, missing_keys = validate_language_files(source_file, lang_file)
+                        if source_file not in missing_keys_by_source:
+                            missing_keys_by_source[source_file] = validate_targets(
+                                source_file, targets_by_source[source_file]
+                            )
+                        is_valid, missing_keys = missing_keys_by_source[source_file][lang_file]
                         if not is_valid:
                             if verbose:
                                 click.echo(f"{Fore.YELLOW}Found {len(missing_keys)} missing keys\x1b[0m")
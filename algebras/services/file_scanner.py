@@ -4,11 +4,62 @@ File scanner for localization files
 
 import os
 import glob
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple, Iterator
 
 from algebras.config import Config
 
 
+def _recursive_suffix(pattern: str) -> Optional[str]:
+    """
+    Return the file suffix of a "**/*<suffix>" pattern such as "**/*.xlf".
+    
+    Returns:
+        The suffix, or None if the pattern has any other shape
+    """
+    if not pattern.startswith("**/*"):
+        return None
+    suffix = pattern[4:]
+    if not suffix or any(char in suffix for char in "*?[/"):
+        return None
+    return suffix
+
+
+def _walk_files_with_suffixes(suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Walk the current directory once and yield files ending with one of the suffixes.
+    
+    Gives the same files as glob.glob("**/*<suffix>", recursive=True) for each
+    suffix: hidden files and directories are skipped and symlinked directories
+    are followed.
+    
+    Args:
+        suffixes: File name suffixes, e.g. (".xlf", ".po")
+        
+    Yields:
+        Relative paths of the matching files
+    """
+    suffixes = tuple(os.path.normcase(suffix) for suffix in suffixes)
+    pending = [""]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            path = os.path.join(directory, entry.name) if directory else entry.name
+            try:
+                if entry.is_dir():
+                    pending.append(path)
+                elif entry.is_file() and os.path.normcase(entry.name).endswith(suffixes):
+                    yield path
+            except OSError:
+                continue
+
+
 class FileScanner:
     """Scanner for finding localization files in the project."""
     
@@ -113,14 +164,24 @@ class FileScanner:
                 else:
                     include_patterns.append(rule)
             
-            # Find all files matching specific locale patterns first
-            for pattern in specific_locale_patterns:
-                for file_path in glob.glob(pattern, recursive=True):
-                    if os.path.isfile(file_path):
-                        all_files.add(os.path.normpath(file_path))
+            # Find all files matching specific locale patterns first, then
+            # user-configured patterns from config (don't just fallback).
+            # Plain "**/*.ext" patterns are all served by a single walk of the
+            # tree instead of one recursive glob each
+            suffixes = set()
+            glob_patterns = []
+            for pattern in specific_locale_patterns + include_patterns:
+                suffix = _recursive_suffix(pattern)
+                if suffix:
+                    suffixes.add(suffix)
+                else:
+                    glob_patterns.append(pattern)
+            
+            if suffixes:
+                for file_path in _walk_files_with_suffixes(tuple(suffixes)):
+                    all_files.add(os.path.normpath(file_path))
             
-            # Also check user-configured patterns from config (don't just fallback)
-            for pattern in include_patterns:
+            for pattern in glob_patterns:
                 for file_path in glob.glob(pattern, recursive=True):
                     if os.path.isfile(file_path):
                         all_files.add(os.path.normpath(file_path))
@@ -0,0 +1,73 @@
+"""
+Helpers shared by the CSV and XLSX translation strategies.
+"""
+
+from typing import Dict, Any, Optional, Callable
+
+from algebras.services.strategies.flat_dict_strategy import FlatDictTranslationStrategy
+
+
+def translate_table_content(
+    flat_strategy: FlatDictTranslationStrategy,
+    content: Dict[str, Any],
+    source_lang: str,
+    target_lang: str,
+    ui_safe: bool = False,
+    glossary_id: Optional[str] = None,
+    translate_text_func: Optional[Callable[[str, str, str, bool, str], str]] = None,
+) -> Dict[str, Any]:
+    """
+    Translate the target language column of table content.
+
+    Each distinct source string is translated once and its translation is
+    given to every row with that string. Only the rows that change are
+    copied, so the input content is never modified.
+
+    Args:
+        flat_strategy: Strategy used to translate the source strings
+        content: Table content dictionary with a "translations" mapping of
+            key to {language: text} rows
+        source_lang: Source language code
+        target_lang: Target language code
+        ui_safe: If True, ensure translations will not be longer than original text
+        glossary_id: Glossary ID to use for translation
+        translate_text_func: Optional function used to translate single strings
+
+    Returns:
+        Updated content with translated strings
+    """
+    # Extract source language strings, keeping only the first key for
+    # each distinct string so that repeated rows are translated once
+    source_strings = {}
+    keys_by_value = {}
+    for key, lang_translations in content["translations"].items():
+        if isinstance(lang_translations, dict) and source_lang in lang_translations:
+            value = lang_translations[source_lang]
+            if value in keys_by_value:
+                keys_by_value[value].append(key)
+            else:
+                keys_by_value[value] = [key]
+                source_strings[key] = value
+
+    # Translate the strings using flat dict strategy
+    unique_translations = flat_strategy.translate(
+        source_strings, source_lang, target_lang, ui_safe, glossary_id, None, translate_text_func
+    )
+
+    # Give every key with the same source string the same translation
+    translated_strings = {}
+    for key, translated_value in unique_translations.items():
+        for same_key in keys_by_value[source_strings[key]]:
+            translated_strings[same_key] = translated_value
+
+    # Update the content, copying only the rows that change
+    translations = dict(content["translations"])
+    for key, translated_value in translated_strings.items():
+        if key in translations:
+            row = dict(translations[key])
+            row[target_lang] = translated_value
+            translations[key] = row
+
+    updated_content = content.copy()
+    updated_content["translations"] = translations
+    return updated_content
@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional, Callable
 
 from algebras.services.strategies.base import TranslationStrategy
 from algebras.services.strategies.flat_dict_strategy import FlatDictTranslationStrategy
+from algebras.services.strategies.table_translation import translate_table_content
 
 
 class XlsxTranslationStrategy(TranslationStrategy):
@@ -64,25 +65,7 @@ class XlsxTranslationStrategy(TranslationStrategy):
         if "translations" not in xlsx_content:
             return xlsx_content
 
-        # Extract source language strings
-        source_strings = {}
-        for key, lang_translations in xlsx_content["translations"].items():
-            if isinstance(lang_translations, dict) and source_lang in lang_translations:
-                source_strings[key] = lang_translations[source_lang]
-
-        # Translate the strings using flat dict strategy
-        translated_strings = self._flat_strategy.translate(
-            source_strings, source_lang, target_lang, ui_safe, glossary_id, None, translate_text_func
+        return translate_table_content(
+            self._flat_strategy, xlsx_content, source_lang, target_lang,
+            ui_safe, glossary_id, translate_text_func
         )
-
-        # Update the XLSX content
-        updated_content = xlsx_content.copy()
-        for key, translated_value in translated_strings.items():
-            if key in updated_content["translations"]:
-                if target_lang not in updated_content["translations"][key]:
-                    updated_content["translations"][key] = updated_content[
-                        "translations"
-                    ][key].copy()
-                updated_content["translations"][key][target_lang] = translated_value
-
-        return updated_content
@@ -1104,11 +1104,21 @@ class Translator:
         """
         updated_content = xliff_content.copy()
 
+        # Copy the files and units on the way down instead of setting targets
+        # on the units of xliff_content, which the caller still owns
         if "files" in updated_content:
+            updated_files = []
             for file_data in updated_content["files"]:
                 if "trans-units" in file_data:
+                    updated_units = []
                     for unit in file_data["trans-units"]:
                         if "id" in unit and unit["id"] in translated_strings:
+                            unit = unit.copy()
                             unit["target"] = translated_strings[unit["id"]]
+                        updated_units.append(unit)
+                    file_data = file_data.copy()
+                    file_data["trans-units"] = updated_units
+                updated_files.append(file_data)
+            updated_content["files"] = updated_files
 
         return updated_content
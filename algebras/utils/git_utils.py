@@ -1,4 +1,5 @@
 import os
+import atexit
 import subprocess
 import argparse
 import sys
@@ -26,11 +27,15 @@ if not logger.handlers:
 _git_file_cache = {}
 _git_key_cache = {}
 _git_blame_cache = {}  # For caching git blame results
+_commit_graph_ready = set()  # Repository roots whose commit-graph has been checked
+_commit_graph_processes = []  # Background commit-graph writes, reaped at exit
 
 
+@lru_cache(maxsize=None)
 def is_git_available() -> bool:
     """
     Check if git is available on the system.
+    The result is cached for the lifetime of the process.
     
     Returns:
         True if git is available, False otherwise
@@ -45,6 +50,7 @@ def is_git_available() -> bool:
 def is_git_repository(path: str) -> bool:
     """
     Check if the given path is within a git repository.
+    Results are cached per directory, so files in the same directory share one git call.
     
     Args:
         path: Path to check
@@ -52,10 +58,23 @@ def is_git_repository(path: str) -> bool:
     Returns:
         True if path is in a git repository, False otherwise
     """
-    try:
-        # Go to the directory containing the file
-        file_dir = os.path.dirname(path) if os.path.isfile(path) else path
+    # Go to the directory containing the file
+    file_dir = os.path.dirname(path) if os.path.isfile(path) else path
+    return _is_git_directory(os.path.abspath(file_dir))
+
+
+@lru_cache(maxsize=1024)
+def _is_git_directory(file_dir: str) -> bool:
+    """
+    Check if the given directory is within a git repository.
+    
+    Args:
+        file_dir: Absolute path of the directory to check
         
+    Returns:
+        True if the directory is in a git repository, False otherwise
+    """
+    try:
         # Check if this is a git repository
         result = subprocess.run(
             ['git', 'rev-parse', '--is-inside-work-tree'],
@@ -69,6 +88,103 @@ def is_git_repository(path: str) -> bool:
         return False
 
 
+def ensure_commit_graph(path: str) -> None:
+    """
+    Start writing a commit-graph with changed-path Bloom filters for the
+    repository containing ``path``.
+    
+    The Bloom filters let ``git log -- <path>`` and ``git blame`` skip commits
+    that did not touch the file, which is what the key tracking queries do.
+    Call this once before a run of batch git queries. The write runs in the
+    background at most once per repository and process, and is skipped when
+    ``core.commitGraph`` is disabled or the repository already has a graph with
+    changed paths. Set ALGEBRAS_SKIP_COMMIT_GRAPH=1 to disable it.
+    
+    Args:
+        path: A file or directory inside the repository
+    """
+    if os.environ.get("ALGEBRAS_SKIP_COMMIT_GRAPH"):
+        return
+    
+    file_dir = os.path.dirname(path) if os.path.isfile(path) else path
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel', '--git-path', 'objects/info'],
+            cwd=os.path.abspath(file_dir),
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        output = result.stdout.strip().splitlines()
+        if result.returncode != 0 or len(output) < 2:
+            return
+        repo_root = output[0]
+        info_dir = os.path.join(os.path.abspath(file_dir), output[1])
+        
+        if repo_root in _commit_graph_ready:
+            return
+        _commit_graph_ready.add(repo_root)
+        
+        config = subprocess.run(
+            ['git', '-C', repo_root, 'config', '--bool', 'core.commitGraph'],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if config.stdout.strip() == 'false' or _has_changed_paths_graph(info_dir):
+            return
+        
+        process = subprocess.Popen(
+            ['git', '-C', repo_root, 'commit-graph', 'write', '--reachable', '--changed-paths', '--split'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if not _commit_graph_processes:
+            atexit.register(_wait_for_commit_graph_writes)
+        _commit_graph_processes.append(process)
+    except OSError as e:
+        logger.debug(f"Could not start commit-graph write: {str(e)}")
+
+
+def _has_changed_paths_graph(info_dir: str) -> bool:
+    """
+    Check whether a repository's newest commit-graph file has Bloom filters.
+    
+    Args:
+        info_dir: The repository's objects/info directory
+        
+    Returns:
+        True if the graph has a changed-paths (BIDX) chunk, False otherwise
+    """
+    graph_path = os.path.join(info_dir, 'commit-graph')
+    chain_path = os.path.join(info_dir, 'commit-graphs', 'commit-graph-chain')
+    try:
+        if os.path.exists(chain_path):
+            with open(chain_path, 'r') as f:
+                hashes = f.read().split()
+            if not hashes:
+                return False
+            graph_path = os.path.join(info_dir, 'commit-graphs', f"graph-{hashes[-1]}.graph")
+        
+        with open(graph_path, 'rb') as f:
+            header = f.read(8)
+            if len(header) < 8 or header[:4] != b'CGPH':
+                return False
+            # The chunk table follows the header: a 4-byte ID and an 8-byte
+            # offset per chunk, plus a terminating entry
+            table = f.read(12 * (header[6] + 1))
+        return any(table[i:i + 4] == b'BIDX' for i in range(0, len(table), 12))
+    except OSError:
+        return False
+
+
+def _wait_for_commit_graph_writes() -> None:
+    """Wait for the commit-graph writes started by this process to finish."""
+    for process in _commit_graph_processes:
+        process.wait()
+
+
 def get_last_modified_date(file_path: str) -> Optional[str]:
     """
     Get the date of the last commit that modified the file.
@@ -116,6 +232,29 @@ def read_file_content(file_path: str) -> Dict:
         raise ValueError(f"Unsupported file format: {file_path}")
 
 
+@lru_cache(maxsize=32)
+def _read_file_lines(file_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Read the lines of a translation file after checking that it parses.
+    Cached per file and modification time, so looking up many keys in one
+    file reads and parses it only once.
+    
+    Args:
+        file_path: Absolute path to the file
+        mtime_ns: Modification time of the file in nanoseconds (cache key only)
+        
+    Returns:
+        Tuple of the lines in the file
+        
+    Raises:
+        ValueError: If the file format is not supported or the content does not parse
+    """
+    # Parse the content first so that malformed files are rejected
+    read_file_content(file_path)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return tuple(f.readlines())
+
+
 @lru_cache(maxsize=1024)
 def get_key_line_number(file_path: str, key: str) -> Optional[int]:
     """
@@ -138,18 +277,12 @@ def get_key_line_number(file_path: str, key: str) -> Optional[int]:
             logger.warning("File not found!")
             return None
             
-        # Read the file content to parse the structure
-        logger.debug("Reading file content...")
-        content = read_file_content(file_path)
-        
         # Split the key into parts for nested access
         key_parts = key.split('.')
         logger.debug(f"Split key into parts: {key_parts}")
         
         # For nested structures, we need to find the exact line where the value is defined
-        logger.debug("Opening file to read lines...")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        lines = _read_file_lines(os.path.abspath(file_path), os.stat(file_path).st_mtime_ns)
         logger.debug(f"Read {len(lines)} lines from file")
         
         # Different handling based on file format
@@ -333,12 +466,14 @@ def get_blame_info_batch(file_path: str, line_numbers: List[int]) -> Dict[int, T
         file_name = os.path.basename(file_path)
         
         # Use git blame to get information for all requested lines
-        # Combine the line ranges to minimize git commands
+        # Combine consecutive lines into ranges to keep the command short
         line_ranges = []
         current_range = []
         
-        # Sort the line numbers to make consecutive range detection easier
-        sorted_lines = sorted(missing_lines)
+        # Sort the distinct line numbers to make consecutive range detection
+        # easier; a repeated line would overlap its own range and git would
+        # print fewer lines than requested, misaligning the output below
+        sorted_lines = sorted(set(missing_lines))
         
         for line in sorted_lines:
             if not current_range or line == current_range[-1] + 1:
@@ -350,33 +485,25 @@ def get_blame_info_batch(file_path: str, line_numbers: List[int]) -> Dict[int, T
         if current_range:
             line_ranges.append(current_range)
         
-        # Process each range of consecutive line numbers
+        # Run git blame once for all ranges; git prints the ranges in line
+        # order, so output lines map back onto the sorted line numbers
+        blame_cmd = ['git', 'blame']
         for line_range in line_ranges:
-            range_start = line_range[0]
-            range_end = line_range[-1]
-            
-            # Run git blame on the range
-            blame_cmd = [
-                'git', 'blame', '-L', f'{range_start},{range_end}', 
-                '--date=iso', '--', file_name
-            ]
-            
-            result = subprocess.run(
-                blame_cmd,
-                cwd=file_dir,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                continue
-                
+            blame_cmd += ['-L', f'{line_range[0]},{line_range[-1]}']
+        blame_cmd += ['--date=iso', '--', file_name]
+        
+        result = subprocess.run(
+            blame_cmd,
+            cwd=file_dir,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        
+        if result.returncode == 0:
             # Parse each line of the blame output
             blame_lines = result.stdout.strip().split('\n')
-            for i, blame_line in enumerate(blame_lines):
-                line_num = range_start + i
-                
+            for line_num, blame_line in zip(sorted_lines, blame_lines):
                 # Extract date and author
                 date_match = re.search(r'(\d{4}-\d{2}-\d{2})', blame_line)
                 author_match = re.search(r'\((.+?)\s+\d{4}-\d{2}-\d{2}', blame_line)
@@ -835,6 +962,15 @@ def get_keys_last_modifications_batch(file_path: str, keys: List[str]) -> Dict[s
     # Get blame info for all line numbers in one batch operation
     blame_info = get_blame_info_batch(file_path, list(line_numbers.values()))
     
+    if not blame_info:
+        # git could not blame the file at all, so the per-key log and blame
+        # fallbacks would fail the same way and end at the file's date;
+        # look that up once instead of spawning several git processes per key
+        date_str = get_last_modified_date(file_path)
+        if date_str:
+            results = dict.fromkeys(line_numbers, date_str)
+        return results
+    
     # Map the blame info back to keys
     for key, line_num in line_numbers.items():
         if line_num in blame_info:
@@ -10,6 +10,7 @@ from algebras.utils.git_utils import (
     get_key_last_modification,
     compare_key_modifications,
     get_keys_last_modifications_batch,
+    ensure_commit_graph,
 )
 from algebras.utils.ts_handler import read_ts_translation_file
 from algebras.utils.android_xml_handler import read_android_xml_file
@@ -29,6 +30,19 @@ from algebras.utils.csv_handler import (
 )
 
 
+# Formats whose readers return flat key-value dictionaries
+FLAT_FORMAT_EXTENSIONS = (
+    ".po",
+    ".xml",
+    ".strings",
+    ".stringsdict",
+    ".xlf",
+    ".xliff",
+    ".csv",
+    ".tsv",
+)
+
+
 def read_language_file(
     file_path: str, language: Optional[str] = None, config: Optional[Any] = None
 ) -> Dict[str, Any]:
@@ -99,17 +113,39 @@ def extract_all_keys(data: Dict[str, Any], prefix: str = "") -> Set[str]:
         Set of all keys in the dictionary, including nested keys and array elements
     """
     keys = set()
+    # Containers still to visit, as (value, key prefix) pairs. An explicit
+    # stack avoids one Python call per node on large nested files
+    stack: List[Tuple[Any, Any]] = []
+
+    # Start extraction from the root dictionary
+    if isinstance(data, dict):
+        for key, value in data.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+            # If value is a primitive (string, number, bool, None), add the key directly
+            if not isinstance(value, (dict, list)):
+                keys.add(full_key)
+            elif isinstance(value, list):
+                # For lists, don't add the intermediate key - only add array element keys
+                stack.append((value, full_key))
+            else:
+                # For dicts, add the intermediate key (e.g., "login", "errors") and visit it
+                keys.add(full_key)
+                stack.append((value, full_key))
 
-    def _extract_recursive(value: Any, current_prefix: str) -> None:
-        """Recursively extract keys from any value type."""
+    while stack:
+        value, current_prefix = stack.pop()
         if isinstance(value, dict):
             # Add the intermediate key (the dict itself) if it has a prefix
             if current_prefix:
                 keys.add(current_prefix)
             for key, val in value.items():
                 full_key = f"{current_prefix}.{key}" if current_prefix else key
-                _extract_recursive(val, full_key)
-        elif isinstance(value, list):
+                if isinstance(val, (dict, list)):
+                    stack.append((val, full_key))
+                elif full_key:
+                    # For strings, numbers, booleans, None - add as a key
+                    keys.add(full_key)
+        else:
             # Process array elements
             for index, item in enumerate(value):
                 array_key = (
@@ -119,29 +155,8 @@ def extract_all_keys(data: Dict[str, Any], prefix: str = "") -> Set[str]:
                 if not isinstance(item, (dict, list)):
                     keys.add(array_key)
                 else:
-                    # If item is a dict or list, recursively extract
-                    _extract_recursive(item, array_key)
-        else:
-            # For strings, numbers, booleans, None - add as a key
-            # This handles leaf values (strings, numbers, etc.)
-            if current_prefix:
-                keys.add(current_prefix)
-
-    # Start extraction from the root dictionary
-    if isinstance(data, dict):
-        for key, value in data.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            # If value is a primitive (string, number, bool, None), add the key directly
-            if not isinstance(value, (dict, list)):
-                keys.add(full_key)
-            elif isinstance(value, list):
-                # For lists, don't add the intermediate key - only add array element keys
-                # Recursively extract keys from array elements
-                _extract_recursive(value, full_key)
-            else:
-                # For dicts, add the intermediate key and recursively extract
-                keys.add(full_key)  # Add the intermediate key (e.g., "login", "errors")
-                _extract_recursive(value, full_key)
+                    # If item is a dict or list, visit it
+                    stack.append((item, array_key))
 
     return keys
 
@@ -157,31 +172,28 @@ def get_key_value(data: Dict[str, Any], key: str) -> Any:
     Returns:
         Value of the key or None if key doesn't exist
     """
-    parts = key.split(".")
     current = data
 
-    for part in parts:
-        if current is None:
-            return None
-
+    for part in key.split("."):
+        # Nested dictionaries are by far the most common case
+        if isinstance(current, dict):
+            # A missing key and an explicit None both end the walk with None
+            current = current.get(part)
+            if current is None:
+                return None
         # Check if current is a list and part is a numeric index
-        if isinstance(current, list):
+        elif isinstance(current, list):
             try:
                 index = int(part)
-                if 0 <= index < len(current):
-                    current = current[index]
-                else:
-                    return None
             except ValueError:
                 # Part is not a number, can't access list with non-numeric key
                 return None
-        # Check if current is a dict
-        elif isinstance(current, dict):
-            if part not in current:
+            if 0 <= index < len(current):
+                current = current[index]
+            else:
                 return None
-            current = current[part]
         else:
-            # Current is neither dict nor list, can't traverse further
+            # Current is neither dict nor list (or is None), can't traverse further
             return None
 
     return current
@@ -208,65 +220,97 @@ def validate_language_files(
     Returns:
         Tuple of (is_valid, missing_keys)
     """
+    return validate_all_targets(
+        source_file, [target_file], source_language, [target_language], config
+    )[0]
+
+
+def validate_all_targets(
+    source_file: str,
+    target_files: List[str],
+    source_language: Optional[str] = None,
+    target_languages: Optional[List[Optional[str]]] = None,
+    config: Optional[Any] = None,
+) -> List[Tuple[bool, Set[str]]]:
+    """
+    Validate several target language files against one source language file.
+    The source file is read and its keys extracted only once.
+
+    Args:
+        source_file: Path to the source language file
+        target_files: Paths to the target language files
+        source_language: Optional language code for CSV files (to extract specific language column from source)
+        target_languages: Optional language codes for CSV files, one per target file
+        config: Optional Config object for locale mapping (used for CSV files)
+
+    Returns:
+        List of (is_valid, missing_keys) tuples in the order of target_files
+    """
+    if target_languages is None:
+        target_languages = [None] * len(target_files)
+
     try:
         # For CSV/TSV files, pass language parameters to read_language_file
         if source_file.endswith((".csv", ".tsv")):
             source_data = read_language_file(source_file, source_language, config)
         else:
             source_data = read_language_file(source_file)
-
-        if target_file.endswith((".csv", ".tsv")):
-            target_data = read_language_file(target_file, target_language, config)
-        else:
-            target_data = read_language_file(target_file)
-
-        # Handle flat dictionary formats (.po, .xml, .strings, .stringsdict, .xlf, .xliff, .csv, .tsv)
-        # These formats return flat key-value dictionaries rather than nested structures
-        if target_file.endswith(
-            (
-                ".po",
-                ".xml",
-                ".strings",
-                ".stringsdict",
-                ".xlf",
-                ".xliff",
-                ".csv",
-                ".tsv",
-            )
-        ):
-            source_keys = set(source_data.keys())
-            target_keys = set(target_data.keys())
-
-            # Find keys that don't exist at all in target
-            missing_keys = source_keys - target_keys
-
-            # Find keys that exist in target but have empty string values
-            common_keys = source_keys & target_keys
-            for key in common_keys:
-                target_value = target_data.get(key)
-                # Treat empty string values as missing keys
-                if target_value == "" or target_value is None:
-                    missing_keys.add(key)
-        else:
-            # Handle nested formats (JSON, YAML, TS)
-            source_keys = extract_all_keys(source_data)
-            target_keys = extract_all_keys(target_data)
-
-            # Find keys that don't exist at all in target
-            missing_keys = source_keys - target_keys
-
-            # Find keys that exist in target but have empty string values
-            common_keys = source_keys & target_keys
-            for key in common_keys:
-                target_value = get_key_value(target_data, key)
-                # Treat empty string values as missing keys
-                if target_value == "":
-                    missing_keys.add(key)
-
-        return len(missing_keys) == 0, missing_keys
     except Exception as e:
         print(f"Error validating language files: {str(e)}")
-        return False, set()
+        return [(False, set()) for _ in target_files]
+
+    # Source keys for flat and nested target formats, computed on first use
+    flat_source_keys = None
+    nested_source_keys = None
+
+    results = []
+    for target_file, target_language in zip(target_files, target_languages):
+        try:
+            if target_file.endswith((".csv", ".tsv")):
+                target_data = read_language_file(target_file, target_language, config)
+            else:
+                target_data = read_language_file(target_file)
+
+            # Handle flat dictionary formats (.po, .xml, .strings, .stringsdict, .xlf, .xliff, .csv, .tsv)
+            # These formats return flat key-value dictionaries rather than nested structures
+            if target_file.endswith(FLAT_FORMAT_EXTENSIONS):
+                if flat_source_keys is None:
+                    flat_source_keys = set(source_data.keys())
+                target_keys = set(target_data.keys())
+
+                # Find keys that don't exist at all in target
+                missing_keys = flat_source_keys - target_keys
+
+                # Find keys that exist in target but have empty string values
+                common_keys = flat_source_keys & target_keys
+                for key in common_keys:
+                    target_value = target_data.get(key)
+                    # Treat empty string values as missing keys
+                    if target_value == "" or target_value is None:
+                        missing_keys.add(key)
+            else:
+                # Handle nested formats (JSON, YAML, TS)
+                if nested_source_keys is None:
+                    nested_source_keys = extract_all_keys(source_data)
+                target_keys = extract_all_keys(target_data)
+
+                # Find keys that don't exist at all in target
+                missing_keys = nested_source_keys - target_keys
+
+                # Find keys that exist in target but have empty string values
+                common_keys = nested_source_keys & target_keys
+                for key in common_keys:
+                    target_value = get_key_value(target_data, key)
+                    # Treat empty string values as missing keys
+                    if target_value == "":
+                        missing_keys.add(key)
+
+            results.append((len(missing_keys) == 0, missing_keys))
+        except Exception as e:
+            print(f"Error validating language files: {str(e)}")
+            results.append((False, set()))
+
+    return results
 
 
 def find_outdated_keys(source_file: str, target_file: str) -> Tuple[bool, Set[str]]:
@@ -315,6 +359,9 @@ def find_outdated_keys(source_file: str, target_file: str) -> Tuple[bool, Set[st
         # Use batch git operations for O(1) performance - single operation for all keys
         print(f"Checking {len(different_value_keys)} keys for outdated status...")
 
+        # Let git skip unrelated commits in the queries below
+        ensure_commit_graph(source_file)
+
         # Get last modification dates for all keys in a single batch operation
         source_dates = get_keys_last_modifications_batch(
             source_file, different_value_keys
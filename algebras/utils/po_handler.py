@@ -6,6 +6,9 @@ import re
 from typing import Dict, Any, List, Tuple
 
 
+QUOTED_STRING_PATTERN = re.compile(r'"(.*)"')
+
+
 def read_po_file(file_path: str) -> Dict[str, Any]:
     """
     Read a .po (gettext) localization file and extract key-value pairs.
@@ -237,10 +240,12 @@ def _parse_po_content(content: str) -> List[Dict[str, Any]]:
     """
     entries = []
     lines = content.split('\n')
+    # Strip every line once; the entry loops below look at most lines twice
+    stripped_lines = [line.strip() for line in lines]
     i = 0
     
     while i < len(lines):
-        line = lines[i].strip()
+        line = stripped_lines[i]
         
         # Skip empty lines
         if not line:
@@ -248,7 +253,7 @@ def _parse_po_content(content: str) -> List[Dict[str, Any]]:
             continue
         
         # Start of a new entry
-        if line.startswith('#') or line.startswith('msgid'):
+        if line.startswith(('#', 'msgid')):
             entry = {
                 'comments': [],
                 'msgctxt': '',
@@ -262,48 +267,48 @@ def _parse_po_content(content: str) -> List[Dict[str, Any]]:
             }
             
             # Collect comments
-            while i < len(lines) and lines[i].strip().startswith('#'):
+            while i < len(lines) and stripped_lines[i].startswith('#'):
                 entry['comments'].append(lines[i])
                 i += 1
             
             # Parse msgctxt (message context) - comes after comments, before msgid
-            if i < len(lines) and lines[i].strip().startswith('msgctxt'):
-                msgctxt_line = lines[i].strip()
+            if i < len(lines) and stripped_lines[i].startswith('msgctxt'):
+                msgctxt_line = stripped_lines[i]
                 entry['msgctxt_lines'].append(msgctxt_line)
                 entry['msgctxt'] = _extract_quoted_string(msgctxt_line)
                 i += 1
                 
                 # Handle multi-line msgctxt
-                while i < len(lines) and lines[i].strip().startswith('"'):
-                    continued_line = lines[i].strip()
+                while i < len(lines) and stripped_lines[i].startswith('"'):
+                    continued_line = stripped_lines[i]
                     entry['msgctxt_lines'].append(continued_line)
                     entry['msgctxt'] += _extract_quoted_string(continued_line)
                     i += 1
             
             # Parse msgid
-            if i < len(lines) and lines[i].strip().startswith('msgid'):
-                msgid_line = lines[i].strip()
+            if i < len(lines) and stripped_lines[i].startswith('msgid'):
+                msgid_line = stripped_lines[i]
                 entry['msgid_lines'].append(msgid_line)
                 entry['msgid'] = _extract_quoted_string(msgid_line)
                 i += 1
                 
                 # Handle multi-line msgid
-                while i < len(lines) and lines[i].strip().startswith('"'):
-                    continued_line = lines[i].strip()
+                while i < len(lines) and stripped_lines[i].startswith('"'):
+                    continued_line = stripped_lines[i]
                     entry['msgid_lines'].append(continued_line)
                     entry['msgid'] += _extract_quoted_string(continued_line)
                     i += 1
             
             # Parse msgstr
-            if i < len(lines) and lines[i].strip().startswith('msgstr'):
-                msgstr_line = lines[i].strip()
+            if i < len(lines) and stripped_lines[i].startswith('msgstr'):
+                msgstr_line = stripped_lines[i]
                 entry['msgstr_lines'].append(msgstr_line)
                 entry['msgstr'] = _extract_quoted_string(msgstr_line)
                 i += 1
                 
                 # Handle multi-line msgstr
-                while i < len(lines) and lines[i].strip().startswith('"'):
-                    continued_line = lines[i].strip()
+                while i < len(lines) and stripped_lines[i].startswith('"'):
+                    continued_line = stripped_lines[i]
                     entry['msgstr_lines'].append(continued_line)
                     entry['msgstr'] += _extract_quoted_string(continued_line)
                     i += 1
@@ -327,7 +332,7 @@ def _extract_quoted_string(line: str) -> str:
         Unescaped string content
     """
     # Find the quoted string content
-    match = re.search(r'"(.*)"', line)
+    match = QUOTED_STRING_PATTERN.search(line)
     if match:
         quoted_content = match.group(1)
         # Unescape the content
@@ -4,6 +4,7 @@ Validates translation quality across all supported formats
 """
 
 import re
+from collections import Counter
 from typing import List, Dict, Tuple, Set, Optional
 from html.parser import HTMLParser
 
@@ -79,6 +80,24 @@ def check_formatting(source: str, target: str, key: Optional[str] = None) -> Lis
     return issues
 
 
+# Placeholder patterns used by extract_placeholders
+# Printf placeholders: %s, %d, %f, %1$s, %02d, etc.
+# Pattern: %[flags][width][.precision][length]specifier or %[position]$[flags][width][.precision][length]specifier
+PRINTF_PATTERN = re.compile(r'%(\d+\$)?[0-9]*\.?[0-9]*[sdioxXucfFeEgGaAnp%]')
+# Python placeholders: %(name)s, %(name)d, etc.
+PYTHON_PATTERN = re.compile(r'%\([^)]+\)[sdioxXucfFeEgGaAn]')
+# Qt placeholders: %1, %2, %3, etc.
+QT_PATTERN = re.compile(r'%[0-9]+')
+# Simple braces (not ICU plural): {variable}
+SIMPLE_BRACE_PATTERN = re.compile(r'\{[a-zA-Z_][a-zA-Z0-9_]*\}')
+# Mustache double braces: {{mustache}}
+MUSTACHE_PATTERN = re.compile(r'\{\{[^}]+\}\}')
+# Variable patterns: $variable, ${variable}
+VAR_PATTERN = re.compile(r'\$\{?[a-zA-Z_][a-zA-Z0-9_]*\}?')
+# @name patterns
+AT_PATTERN = re.compile(r'@[a-zA-Z_][a-zA-Z0-9_]*')
+
+
 def extract_placeholders(text: str) -> Dict[str, List[str]]:
     """
     Extract all placeholders from a string.
@@ -95,26 +114,21 @@ def extract_placeholders(text: str) -> Dict[str, List[str]]:
     }
     
     # Printf placeholders: %s, %d, %f, %1$s, %02d, etc.
-    # Pattern: %[flags][width][.precision][length]specifier or %[position]$[flags][width][.precision][length]specifier
-    printf_pattern = r'%(\d+\$)?[0-9]*\.?[0-9]*[sdioxXucfFeEgGaAnp%]'
-    for match in re.finditer(printf_pattern, text):
+    for match in PRINTF_PATTERN.finditer(text):
         placeholder = match.group(0)
         if placeholder != '%%':  # Skip escaped %
             placeholders['printf'].append(placeholder)
     
     # Python placeholders: %(name)s, %(name)d, etc.
-    python_pattern = r'%\([^)]+\)[sdioxXucfFeEgGaAn]'
-    for match in re.finditer(python_pattern, text):
+    for match in PYTHON_PATTERN.finditer(text):
         placeholders['python'].append(match.group(0))
     
     # Qt placeholders: %1, %2, %3, etc.
-    qt_pattern = r'%[0-9]+'
-    for match in re.finditer(qt_pattern, text):
+    for match in QT_PATTERN.finditer(text):
         placeholders['qt'].append(match.group(0))
     
     # ICU placeholders: {variable}, {count, plural, ...}, etc.
     # This is more complex, need to handle nested braces
-    icu_pattern = r'\{[^}]*\}'
     brace_depth = 0
     current_icu = ''
     i = 0
@@ -138,26 +152,22 @@ def extract_placeholders(text: str) -> Dict[str, List[str]]:
     
     # Other common patterns: {variable}, {0}, $variable, ${variable}, @name, {{mustache}}
     # Simple braces (not ICU plural)
-    simple_brace_pattern = r'\{[a-zA-Z_][a-zA-Z0-9_]*\}'
-    for match in re.finditer(simple_brace_pattern, text):
+    for match in SIMPLE_BRACE_PATTERN.finditer(text):
         placeholder = match.group(0)
         # Skip if already captured as ICU
         if not any(placeholder in icu for icu in placeholders['icu']):
             placeholders['other'].append(placeholder)
     
     # Mustache double braces
-    mustache_pattern = r'\{\{[^}]+\}\}'
-    for match in re.finditer(mustache_pattern, text):
+    for match in MUSTACHE_PATTERN.finditer(text):
         placeholders['other'].append(match.group(0))
     
     # Variable patterns: $variable, ${variable}
-    var_pattern = r'\$\{?[a-zA-Z_][a-zA-Z0-9_]*\}?'
-    for match in re.finditer(var_pattern, text):
+    for match in VAR_PATTERN.finditer(text):
         placeholders['other'].append(match.group(0))
     
     # @name patterns
-    at_pattern = r'@[a-zA-Z_][a-zA-Z0-9_]*'
-    for match in re.finditer(at_pattern, text):
+    for match in AT_PATTERN.finditer(text):
         placeholders['other'].append(match.group(0))
     
     return placeholders
@@ -235,6 +245,10 @@ def check_placeholders(source: str, target: str, key: Optional[str] = None) -> L
     return issues
 
 
+# Numbers (integers and floats)
+NUMBER_PATTERN = re.compile(r'\b\d+\.?\d*\b')
+
+
 def check_numbers(source: str, target: str, key: Optional[str] = None) -> List[Issue]:
     """
     Check numeric values consistency.
@@ -250,9 +264,8 @@ def check_numbers(source: str, target: str, key: Optional[str] = None) -> List[I
     issues = []
     
     # Extract numbers (integers and floats)
-    number_pattern = r'\b\d+\.?\d*\b'
-    source_numbers = re.findall(number_pattern, source)
-    target_numbers = re.findall(number_pattern, target)
+    source_numbers = NUMBER_PATTERN.findall(source)
+    target_numbers = NUMBER_PATTERN.findall(target)
     
     # Compare numbers
     if len(source_numbers) != len(target_numbers):
@@ -498,6 +511,18 @@ def check_html_xml_tags(source: str, target: str, key: Optional[str] = None) ->
     return issues
 
 
+# Common non-translatable token patterns used by check_non_translatable_tokens
+TOKEN_PATTERNS = [
+    (re.compile(r'\{[a-zA-Z_][a-zA-Z0-9_]*\}'), 'brace_variable'),  # {variable}
+    (re.compile(r'\{[0-9]+\}'), 'brace_number'),  # {0}, {1}
+    (re.compile(r'%\{[^}]+\}'), 'percent_brace'),  # %{count}
+    (re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*'), 'dollar_variable'),  # $variable
+    (re.compile(r'\$\{[^}]+\}'), 'dollar_brace'),  # ${variable}
+    (re.compile(r'@[a-zA-Z_][a-zA-Z0-9_]*'), 'at_variable'),  # @name
+    (re.compile(r'\{\{[^}]+\}\}'), 'mustache'),  # {{mustache}}
+]
+
+
 def check_non_translatable_tokens(source: str, target: str, key: Optional[str] = None) -> List[Issue]:
     """
     Check non-translatable tokens consistency.
@@ -513,23 +538,12 @@ def check_non_translatable_tokens(source: str, target: str, key: Optional[str] =
     issues = []
     
     # Extract tokens (already handled in placeholders, but check specific patterns)
-    # Common non-translatable patterns
-    token_patterns = [
-        (r'\{[a-zA-Z_][a-zA-Z0-9_]*\}', 'brace_variable'),  # {variable}
-        (r'\{[0-9]+\}', 'brace_number'),  # {0}, {1}
-        (r'%\{[^}]+\}', 'percent_brace'),  # %{count}
-        (r'\$[a-zA-Z_][a-zA-Z0-9_]*', 'dollar_variable'),  # $variable
-        (r'\$\{[^}]+\}', 'dollar_brace'),  # ${variable}
-        (r'@[a-zA-Z_][a-zA-Z0-9_]*', 'at_variable'),  # @name
-        (r'\{\{[^}]+\}\}', 'mustache'),  # {{mustache}}
-    ]
-    
     source_tokens = {}
     target_tokens = {}
     
-    for pattern, token_type in token_patterns:
-        source_matches = re.findall(pattern, source)
-        target_matches = re.findall(pattern, target)
+    for pattern, token_type in TOKEN_PATTERNS:
+        source_matches = pattern.findall(source)
+        target_matches = pattern.findall(target)
         
         source_tokens[token_type] = source_matches
         target_tokens[token_type] = target_matches
@@ -566,11 +580,21 @@ def check_non_translatable_tokens(source: str, target: str, key: Optional[str] =
     return issues
 
 
+# XLIFF tags: <ph .../>, <pc>...</pc>, <sc .../>, <ec .../>, <mrk>...</mrk>
+# Matches the start of any of them; extract_xliff_placeholders finds the rest
+XLIFF_TAG_OPEN_PATTERN = re.compile(r'<(ph|pc|sc|ec|mrk)', re.IGNORECASE)
+
+# Closing tag patterns by lowercased tag name, compiled on first use
+_XLIFF_CLOSING_PATTERNS: Dict[str, 're.Pattern[str]'] = {}
+
+
 def extract_xliff_placeholders(text: str) -> List[str]:
     """
     Extract XLIFF-specific placeholders from text.
     
     Detects XLIFF-specific tags: ph, pc, sc, ec, mrk and their attributes.
+    A tag followed later by its closing tag is taken up to the first closing
+    tag, otherwise a tag ending in ``/>`` is taken on its own.
     
     Args:
         text: Text that may contain XLIFF placeholders
@@ -578,17 +602,42 @@ def extract_xliff_placeholders(text: str) -> List[str]:
     Returns:
         List of placeholder strings (XML tags as strings)
     """
-    placeholders = []
-    
     if not text:
-        return placeholders
-    
-    # Pattern to match XLIFF tags: <ph .../>, <pc>...</pc>, <sc .../>, <ec .../>, <mrk>...</mrk>
-    # This matches self-closing tags and paired tags
-    xliff_tag_pattern = r'<(ph|pc|sc|ec|mrk)[^>]*(?:/>|>.*?</\1>)'
+        return []
     
-    for match in re.finditer(xliff_tag_pattern, text, re.DOTALL | re.IGNORECASE):
-        placeholders.append(match.group(0))
+    placeholders = []
+    # Next closing tag found for each tag name, or None once there is none
+    # left, so unclosed tags do not rescan the rest of the text every time
+    next_closing: Dict[str, Optional['re.Match[str]']] = {}
+    pos = 0
+    while True:
+        match = XLIFF_TAG_OPEN_PATTERN.search(text, pos)
+        if match is None:
+            break
+        start = match.start()
+        tag_end = text.find('>', match.end())
+        if tag_end < 0:
+            break
+        
+        name = match.group(1).lower()
+        if name not in next_closing or (next_closing[name] is not None
+                                        and next_closing[name].start() <= tag_end):
+            pattern = _XLIFF_CLOSING_PATTERNS.get(name)
+            if pattern is None:
+                pattern = re.compile('</' + re.escape(name) + '>', re.IGNORECASE)
+                _XLIFF_CLOSING_PATTERNS[name] = pattern
+            next_closing[name] = pattern.search(text, tag_end + 1)
+        closing = next_closing[name]
+        
+        if closing is not None:
+            end = closing.end()
+        elif text[tag_end - 1] == '/':
+            end = tag_end + 1
+        else:
+            pos = start + 1
+            continue
+        placeholders.append(text[start:end])
+        pos = end
     
     return placeholders
 
@@ -607,17 +656,13 @@ def check_xliff_placeholders(source: str, target: str, key: Optional[str] = None
     """
     issues = []
     
-    source_placeholders = extract_xliff_placeholders(source)
-    target_placeholders = extract_xliff_placeholders(target)
-    
-    # Count occurrences
-    source_counts = {}
-    for pl in source_placeholders:
-        source_counts[pl] = source_counts.get(pl, 0) + 1
+    # Most strings carry no markup at all; skip the tag scan for them
+    if '<' not in (source or '') and '<' not in (target or ''):
+        return issues
     
-    target_counts = {}
-    for pl in target_placeholders:
-        target_counts[pl] = target_counts.get(pl, 0) + 1
+    # Count occurrences; comparing the two counters is linear in the number of placeholders
+    source_counts = Counter(extract_xliff_placeholders(source))
+    target_counts = Counter(extract_xliff_placeholders(target))
     
     # Check for missing placeholders
     for pl, count in source_counts.items():
@@ -3,20 +3,44 @@ XLIFF (XML Localization Interchange File Format) file handler
 """
 
 import os
+import re
+import shutil
+import tempfile
 import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
-from xml.dom import minidom
+from typing import Dict, Any, List, Optional, Union, IO
+from xml.sax.saxutils import escape, quoteattr
 
 logger = logging.getLogger(__name__)
 
+_XLIFF_NS_1_2 = 'urn:oasis:names:tc:xliff:document:1.2'
+_XLIFF_NS_2_0 = 'urn:oasis:names:tc:xliff:document:2.0'
 
-def read_xliff_file(file_path: str) -> Dict[str, Any]:
+_XLIFF_TAG_NAMES = ('file', 'trans-unit', 'unit', 'segment', 'source', 'target')
+
+
+def _qualify_tags(namespace: str) -> Dict[str, str]:
+    """Map local XLIFF tag names to ElementTree tag names in ``namespace``."""
+    prefix = f'{{{namespace}}}' if namespace else ''
+    return {tag: prefix + tag for tag in _XLIFF_TAG_NAMES}
+
+
+# Qualified tag names for the namespaces XLIFF documents normally use
+_XLIFF_TAGS_BY_NAMESPACE = {
+    namespace: _qualify_tags(namespace) for namespace in ('', _XLIFF_NS_1_2, _XLIFF_NS_2_0)
+}
+
+# Language segment right before the extension: messages.en.xlf, messages.en_US.xlf
+_FILENAME_LANG_RE = re.compile(r'\.([A-Za-z]{2}(?:[_-][A-Za-z]{2})?)\.[^.]+$')
+
+
+def read_xliff_file(file_path: Union[str, os.PathLike, IO[bytes]]) -> Dict[str, Any]:
     """
     Read an XLIFF file and return its content as a dictionary.
     
     Args:
-        file_path: Path to the XLIFF file
+        file_path: Path to the XLIFF file, or a binary file object
+            (e.g. ``io.BytesIO``) that is parsed without touching the disk
         
     Returns:
         Dictionary containing the XLIFF file content
@@ -25,204 +49,252 @@ def read_xliff_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file is not valid XLIFF format
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"XLIFF file not found: {file_path}")
-    
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        raise ValueError(f"Invalid XML in XLIFF file {file_path}: {str(e)}")
-    
-    # Check if it's a valid XLIFF file
-    if root.tag != 'xliff' and not root.tag.endswith('}xliff'):
-        raise ValueError(f"File {file_path} is not a valid XLIFF file")
-    
-    return _parse_xliff_root(root)
+    if hasattr(file_path, 'read'):
+        name = getattr(file_path, 'name', '<stream>')
+        try:
+            result = _parse_xliff_stream(file_path)
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML in XLIFF file {name}: {str(e)}")
+    else:
+        name = file_path
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"XLIFF file not found: {file_path}")
+        
+        try:
+            with open(file_path, 'rb') as f:
+                result = _parse_xliff_stream(f)
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML in XLIFF file {file_path}: {str(e)}")
+    
+    if result is None:
+        raise ValueError(f"File {name} is not a valid XLIFF file")
+    return result
 
 
-def write_xliff_file(file_path: str, content: Dict[str, Any], 
+def write_xliff_file(file_path: Union[str, os.PathLike, IO[bytes]], content: Dict[str, Any], 
                     source_language: str = "en", target_language: str = "en",
-                    target_state: Optional[str] = None) -> None:
+                    target_state: Optional[str] = None) -> bytes:
     """
     Write content to an XLIFF file.
     
+    Each unit is rendered straight to a text chunk, so no intermediate XML
+    tree is built in memory. The document is written to a temporary file
+    next to ``file_path`` and moved into place, so readers never see a
+    partially written file.
+    
     Args:
-        file_path: Path where to write the XLIFF file
+        file_path: Path where to write the XLIFF file, or a binary file
+            object (e.g. ``io.BytesIO``) the document is written to directly
         content: Dictionary containing the XLIFF content
         source_language: Source language code
         target_language: Target language code
         target_state: Optional state attribute to add to target elements (e.g., "translated", "needs-review-translation")
         
+    Returns:
+        The serialized XLIFF document as UTF-8 bytes
+        
     Raises:
         ValueError: If content is not a valid dictionary
     """
     if not isinstance(content, dict):
         raise ValueError("XLIFF content must be a dictionary")
     
-    # Ensure the directory exists
-    if os.path.dirname(file_path):
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    
     # Determine XLIFF version from content or default to 1.2
     version = content.get('version', '1.2')
     if version == '2.0':
-        namespace = 'urn:oasis:names:tc:xliff:document:2.0'
-        xmlns_attr = namespace
+        namespace = _XLIFF_NS_2_0
     else:
-        namespace = 'urn:oasis:names:tc:xliff:document:1.2'
-        xmlns_attr = namespace
+        namespace = _XLIFF_NS_1_2
         version = '1.2'
     
     logger.debug(f"Writing XLIFF file with version {version}, target_state={target_state}")
     
-    # Create XLIFF structure
-    xliff_root = ET.Element('xliff')
-    xliff_root.set('version', version)
-    xliff_root.set('xmlns', xmlns_attr)
+    # Check for structured format: must have 'files' key and it must be a list (even if empty)
+    # Empty list is valid - it means no units yet, but we still use structured format
+    structured = 'files' in content and isinstance(content['files'], list)
+    file_data = content['files'][0] if structured and content['files'] else None
     
     # Get source language from content if available
-    if 'files' in content and content['files'] and content['files'][0].get('source-language'):
-        source_language = content['files'][0]['source-language']
+    if file_data and file_data.get('source-language'):
+        source_language = file_data['source-language']
     
+    xliff_attrs = {'xmlns': namespace, 'version': version}
     # For XLIFF 2.0, set srcLang on root element
     if version == '2.0':
-        xliff_root.set('srcLang', source_language)
-    
-    file_elem = ET.SubElement(xliff_root, 'file')
+        xliff_attrs['srcLang'] = source_language
     
     # Preserve original file attributes from content if available
-    if 'files' in content and content['files']:
-        file_data = content['files'][0]
-        file_elem.set('original', file_data.get('original', 'messages'))
-        file_elem.set('source-language', file_data.get('source-language', source_language))
-        file_elem.set('target-language', file_data.get('target-language', target_language))
+    if file_data is not None:
+        file_attrs = {
+            'original': file_data.get('original', 'messages'),
+            'source-language': file_data.get('source-language', source_language),
+            'target-language': file_data.get('target-language', target_language),
+        }
         if file_data.get('datatype'):
-            file_elem.set('datatype', file_data['datatype'])
+            file_attrs['datatype'] = file_data['datatype']
         if version == '2.0' and file_data.get('id'):
-            file_elem.set('id', file_data['id'])
-    else:
-        file_elem.set('original', 'messages')
-        file_elem.set('source-language', source_language)
-        file_elem.set('target-language', target_language)
-        file_elem.set('datatype', 'plaintext')
-    
-    if version == '2.0':
-        # XLIFF 2.0: units go directly under file, not in body
-        container = file_elem
+            file_attrs['id'] = file_data['id']
     else:
-        # XLIFF 1.2: units go in body
-        body_elem = ET.SubElement(file_elem, 'body')
-        container = body_elem
+        file_attrs = {
+            'original': 'messages',
+            'source-language': source_language,
+            'target-language': target_language,
+            'datatype': 'plaintext',
+        }
     
-    # Handle different content structures
-    # Check for structured format: must have 'files' key and it must be a list (even if empty)
-    # Empty list is valid - it means no units yet, but we still use structured format
-    if 'files' in content and isinstance(content['files'], list):
-        # Use the first file's data
-        file_data = content['files'][0]
-        if 'trans-units' in file_data:
-            for unit in file_data['trans-units']:
-                if 'id' in unit and 'source' in unit:
-                    if version == '2.0':
-                        # XLIFF 2.0: use <unit> with <segment>
-                        unit_elem = ET.SubElement(container, 'unit')
-                        unit_elem.set('id', unit['id'])
-                        segment = ET.SubElement(unit_elem, 'segment')
-                        source_elem = ET.SubElement(segment, 'source')
-                        source_elem.text = unit['source']
-                        target_elem = ET.SubElement(segment, 'target')
-                        target_elem.text = unit.get('target', unit['source'])
-                        # For XLIFF 2.0, state goes on segment, not target
-                        # Only add state if unit explicitly has one and it's not empty
-                        unit_state = unit.get('state')
-                        if unit_state and unit_state.strip():
-                            segment.set('state', unit_state)
-                            logger.debug(f"Added state '{unit_state}' to segment for unit {unit.get('id', 'unknown')} (XLIFF 2.0)")
-                    else:
-                        # XLIFF 1.2: use <trans-unit>
-                        trans_unit = ET.SubElement(container, 'trans-unit')
-                        trans_unit.set('id', unit['id'])
-                        source_elem = ET.SubElement(trans_unit, 'source')
-                        source_elem.text = unit['source']
-                        target_elem = ET.SubElement(trans_unit, 'target')
-                        target_elem.text = unit.get('target', unit['source'])
-                        # For XLIFF 1.2, state goes on target
-                        # Only add state if unit explicitly has one and it's not empty
-                        unit_state = unit.get('state')
-                        if unit_state and unit_state.strip():
-                            target_elem.set('state', unit_state)
-                            logger.debug(f"Added state '{unit_state}' to target for unit {unit.get('id', 'unknown')} (XLIFF 1.2)")
+    # XLIFF 2.0 units go directly under file, XLIFF 1.2 units go in body
+    unit_indent = '    ' if version == '2.0' else '      '
+    child_indent = unit_indent + '  '
+    
+    # Each unit is rendered as a single string chunk; the document is joined once
+    chunks: List[str] = []
+    if structured:
+        units = file_data.get('trans-units', []) if file_data else []
+        # A file uses only a handful of distinct states; render each attribute once
+        state_attrs: Dict[str, str] = {}
+        for unit in units:
+            if 'id' not in unit or 'source' not in unit:
+                continue
+            target_text = unit.get('target', unit['source'])
+            # Only add state if unit explicitly has one and it's not empty
+            unit_state = unit.get('state')
+            if unit_state and unit_state.strip():
+                state_attr = state_attrs.get(unit_state)
+                if state_attr is None:
+                    state_attr = state_attrs[unit_state] = f' state={quoteattr(unit_state)}'
+            else:
+                state_attr = ''
+            
+            if version == '2.0':
+                # XLIFF 2.0: use <unit> with <segment>; state goes on segment, not target
+                chunks.append(
+                    f'{unit_indent}<unit id={quoteattr(unit["id"])}>\n'
+                    f'{child_indent}<segment{state_attr}>\n'
+                    + _xml_leaf(child_indent + '  ', 'source', unit['source'])
+                    + _xml_leaf(child_indent + '  ', 'target', target_text)
+                    + f'{child_indent}</segment>\n'
+                    f'{unit_indent}</unit>\n'
+                )
+                if state_attr:
+                    logger.debug(f"Added state '{unit_state}' to segment for unit {unit['id']} (XLIFF 2.0)")
+            else:
+                # XLIFF 1.2: use <trans-unit>; state goes on target
+                chunks.append(
+                    f'{unit_indent}<trans-unit id={quoteattr(unit["id"])}>\n'
+                    + _xml_leaf(child_indent, 'source', unit['source'])
+                    + _xml_leaf(child_indent, 'target', target_text, state_attr)
+                    + f'{unit_indent}</trans-unit>\n'
+                )
+                if state_attr:
+                    logger.debug(f"Added state '{unit_state}' to target for unit {unit['id']} (XLIFF 1.2)")
     else:
-        # Handle flat dictionary structure (always write as XLIFF 1.2)
+        # Handle flat dictionary structure (always written as XLIFF 1.2)
         # Skip metadata keys like 'version' that shouldn't be translation units
         metadata_keys = {'version'}
+        # Add state if target_state is provided (for flat dict structure from new file creation)
+        state_attr = f' state={quoteattr(target_state)}' if target_state else ''
         for key, value in content.items():
-            if key in metadata_keys:
-                continue  # Skip metadata keys
-            if isinstance(value, str):
-                trans_unit = ET.SubElement(container, 'trans-unit')
-                trans_unit.set('id', key)
-                source_elem = ET.SubElement(trans_unit, 'source')
-                source_elem.text = value
-                target_elem = ET.SubElement(trans_unit, 'target')
-                target_elem.text = value
-                # Add state if target_state is provided (for flat dict structure from new file creation)
-                if target_state:
-                    target_elem.set('state', target_state)
-                    logger.debug(f"Added state '{target_state}' to target for unit {key} from flat dict (XLIFF 1.2)")
-    
-    # Write to file with proper formatting
-    # Use ET.tostring with xml_declaration for better compatibility
-    rough_string = ET.tostring(xliff_root, encoding='unicode', xml_declaration=True)
-    reparsed = minidom.parseString(rough_string)
-    pretty_xml = reparsed.toprettyxml(indent="  ", encoding='utf-8')
+            if key in metadata_keys or not isinstance(value, str):
+                continue
+            chunks.append(
+                f'{unit_indent}<trans-unit id={quoteattr(key)}>\n'
+                + _xml_leaf(child_indent, 'source', value)
+                + _xml_leaf(child_indent, 'target', value, state_attr)
+                + f'{unit_indent}</trans-unit>\n'
+            )
+            if target_state:
+                logger.debug(f"Added state '{target_state}' to target for unit {key} from flat dict (XLIFF 1.2)")
+    
+    # Same layout as minidom's toprettyxml(indent="  "): childless elements are self-closed.
+    # Enclosing tags are added around the unit chunks and everything is joined
+    # once, so the unit text is not copied again for every enclosing element
+    if version != '2.0':
+        _xml_wrap(chunks, '    ', 'body', '')
+    _xml_wrap(chunks, '  ', 'file', _xml_attrs(file_attrs))
+    _xml_wrap(chunks, '', 'xliff', _xml_attrs(xliff_attrs))
+    chunks.insert(0, '<?xml version="1.0" encoding="utf-8"?>\n')
+    data = ''.join(chunks).encode('utf-8')
+    
+    if hasattr(file_path, 'write'):
+        file_path.write(data)
+        return data
     
-    # Ensure the file is written correctly
-    with open(file_path, 'wb') as f:
-        f.write(pretty_xml)
+    # Ensure the directory exists
+    if os.path.dirname(file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
     
-    # Verify the written file can be parsed correctly
-    # This ensures namespace handling is correct
+    # Replace the file a symlink points to, not the symlink itself, and keep
+    # the permissions of the file being replaced
+    target_path = os.path.realpath(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), suffix='.tmp')
     try:
-        test_tree = ET.parse(file_path)
-        test_root = test_tree.getroot()
-        # Try to find target element to verify it's accessible
-        # This helps catch namespace issues early
-        test_target = test_root.find(f'.//{{{namespace}}}target')
-        if test_target is None:
-            test_target = test_root.find('.//target')
-    except Exception:
-        # If verification fails, it's not critical - the file was still written
-        pass
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if os.path.exists(target_path):
+            shutil.copymode(target_path, temp_path)
+        else:
+            # mkstemp creates the file readable by its owner only
+            os.chmod(temp_path, 0o666 & ~_current_umask())
+        os.replace(temp_path, target_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return data
+
+
+def _current_umask() -> int:
+    """Return the process umask, which can only be read by setting it."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _xml_attrs(attrs: Dict[str, str]) -> str:
+    """Render attributes as they appear inside a start tag, each with a leading space."""
+    return ''.join(f' {name}={quoteattr(value)}' for name, value in attrs.items())
+
+
+def _xml_wrap(chunks: List[str], indent: str, tag: str, attrs: str) -> None:
+    """Enclose the rendered children in ``chunks`` in an element, in place; self-closed when empty."""
+    if chunks:
+        chunks.insert(0, f'{indent}<{tag}{attrs}>\n')
+        chunks.append(f'{indent}</{tag}>\n')
+    else:
+        chunks.append(f'{indent}<{tag}{attrs}/>\n')
+
+
+def _xml_leaf(indent: str, tag: str, text: Optional[str], attrs: str = '') -> str:
+    """Render a text-only element on its own line, self-closed when it has no text."""
+    if text:
+        return f'{indent}<{tag}{attrs}>{escape(text)}</{tag}>\n'
+    return f'{indent}<{tag}{attrs}/>\n'
 
 
 def extract_translatable_strings(xliff_content: Dict[str, Any]) -> Dict[str, str]:
     """
     Extract translatable strings from XLIFF content.
     
+    Source texts, including inline codes, are serialized once when the file
+    is read, so this only collects the stored strings.
+    
     Args:
         xliff_content: XLIFF file content as dictionary
         
     Returns:
         Dictionary of key-value pairs for translatable strings
     """
-    translatable = {}
-    
     # Look for translation units in the content
     if 'files' in xliff_content:
-        for file_data in xliff_content['files']:
-            if 'trans-units' in file_data:
-                for unit in file_data['trans-units']:
-                    if 'id' in unit and 'source' in unit:
-                        translatable[unit['id']] = unit['source']
-    else:
-        # If it's a flat dictionary, use it directly
-        for key, value in xliff_content.items():
-            if isinstance(value, str):
-                translatable[key] = value
-    
-    return translatable
+        return {
+            unit['id']: unit['source']
+            for file_data in xliff_content['files']
+            for unit in file_data.get('trans-units', ())
+            if 'id' in unit and 'source' in unit
+        }
+
+    # If it's a flat dictionary, use it directly
+    return {key: value for key, value in xliff_content.items() if isinstance(value, str)}
 
 
 def create_xliff_from_translations(translations: Dict[str, str], 
@@ -265,35 +337,38 @@ def update_xliff_targets(xliff_content: Dict[str, Any], translations: Dict[str,
     Update XLIFF target elements with translated strings while preserving source text.
     Also adds new units from source that don't exist in target.
     
+    ``xliff_content`` is updated in place and returned, so large files are not
+    copied; callers that need the original structure must copy it themselves.
+    
     Args:
-        xliff_content: Original XLIFF content structure (target file)
+        xliff_content: Original XLIFF content structure (target file), modified in place
         translations: Dictionary of translated strings (key -> translated_value)
         source_content: Optional source XLIFF content to add missing units from
         target_state: Optional state attribute to add to target elements (e.g., "translated", "needs-review-translation")
+        only_missing: If True, keep targets that are already non-empty
         
     Returns:
-        Updated XLIFF content with target elements updated and new units added
+        The same ``xliff_content`` object with target elements updated and new units added
     """
-    import copy
-    updated_content = copy.deepcopy(xliff_content)
+    updated_content = xliff_content
     
     # Ensure version is preserved in updated content
-    # If version is missing, try to get it from source_content or original xliff_content
+    # If version is missing, try to get it from source_content
     if 'version' not in updated_content:
         if source_content and 'version' in source_content:
             updated_content['version'] = source_content['version']
             logger.debug(f"XLIFF version {source_content['version']} copied from source_content")
-        elif 'version' in xliff_content:
-            updated_content['version'] = xliff_content['version']
-            logger.debug(f"XLIFF version {xliff_content['version']} preserved from xliff_content")
     else:
         logger.debug(f"XLIFF version {updated_content['version']} already present in updated_content")
     
     final_version = updated_content.get('version', 'unknown')
     logger.debug(f"Processing XLIFF with version {final_version}, target_state={target_state}, only_missing={only_missing}")
     
-    # Track which unit IDs already exist in target
-    existing_unit_ids = set()
+    # Index of unit ID -> unit for every unit already present in target, so that
+    # merging source units is a dict lookup rather than a scan of the target units.
+    # It is only built when there are source units to merge
+    merge_source = bool(source_content and source_content.get('files'))
+    units_by_id: Dict[str, Dict[str, Any]] = {}
     
     # Ensure 'files' structure exists
     if 'files' not in updated_content:
@@ -316,68 +391,76 @@ def update_xliff_targets(xliff_content: Dict[str, Any], translations: Dict[str,
                 for unit in file_data['trans-units']:
                     unit_id = unit.get('id')
                     if unit_id:
-                        existing_unit_ids.add(unit_id)
-                        existing_target = unit.get('target', '').strip()
-                        existing_state = unit.get('state')
+                        if merge_source:
+                            units_by_id.setdefault(unit_id, unit)
                         
+                        # Existing units keep whatever state they already have:
+                        # new state is only added to units merged from source
                         if unit_id in translations:
                             # Update target with translation
                             # If only_missing is True, only update if target is empty
-                            if only_missing and existing_target:
-                                # Preserve existing target when in only-missing mode
-                                pass
-                            else:
-                                # Update target (either not only-missing mode, or target is empty)
+                            if not (only_missing and unit.get('target', '').strip()):
                                 unit['target'] = translations[unit_id]
-                            
-                            # For existing units, preserve existing state if present
-                            # DO NOT add new state to existing units
-                            if existing_state:
-                                unit['state'] = existing_state
-                                logger.debug(f"Preserved existing state '{existing_state}' for unit {unit_id}")
-                        elif 'source' in unit and not existing_target:
+                            if unit.get('state'):
+                                logger.debug(f"Preserved existing state '{unit['state']}' for unit {unit_id}")
+                        elif 'source' in unit and not unit.get('target', '').strip():
                             # If no translation provided but source exists and target is empty
                             # Leave target empty rather than copying source - this indicates missing translation
                             logger.debug(f"No translation provided for existing unit {unit_id}, leaving target empty")
                             unit['target'] = ''
-                            # DO NOT add state to existing units
     
     # Add new units from source that don't exist in target
-    if source_content and 'files' in source_content:
+    if merge_source and updated_content['files']:
+        # New units are appended to the first target file
+        target_file_data = updated_content['files'][0]
+        target_units = target_file_data.setdefault('trans-units', [])
+        
         for source_file_data in source_content['files']:
-            if 'trans-units' in source_file_data:
-                # Find the corresponding target file data
-                target_file_data = None
-                if 'files' in updated_content and updated_content['files']:
-                    target_file_data = updated_content['files'][0]
-                    if 'trans-units' not in target_file_data:
-                        target_file_data['trans-units'] = []
+            for source_unit_id, source_unit in _index_units_by_id(source_file_data).items():
+                if source_unit_id in units_by_id:
+                    continue
+                # This is a new unit from source, add it to target
+                # Check if we have a translation, otherwise use empty string (not source)
+                target_value = translations.get(source_unit_id, '')
+                if not target_value:
+                    # No translation provided - this is important to detect
+                    logger.warning(f"No translation provided for new unit {source_unit_id}, using empty target")
                 
-                if target_file_data:
-                    for source_unit in source_file_data['trans-units']:
-                        source_unit_id = source_unit.get('id')
-                        if source_unit_id and source_unit_id not in existing_unit_ids:
-                            # This is a new unit from source, add it to target
-                            # Check if we have a translation, otherwise use empty string (not source)
-                            target_value = translations.get(source_unit_id, '')
-                            if not target_value:
-                                # No translation provided - this is important to detect
-                                logger.warning(f"No translation provided for new unit {source_unit_id}, using empty target")
-                            
-                            new_unit = {
-                                'id': source_unit_id,
-                                'source': source_unit.get('source', ''),
-                                'target': target_value
-                            }
-                            # Add state attribute if provided
-                            if target_state:
-                                new_unit['state'] = target_state
-                                logger.debug(f"Added state '{target_state}' to new unit {source_unit_id} from source")
-                            target_file_data['trans-units'].append(new_unit)
+                new_unit = {
+                    'id': source_unit_id,
+                    'source': source_unit.get('source', ''),
+                    'target': target_value
+                }
+                # Add state attribute if provided
+                if target_state:
+                    new_unit['state'] = target_state
+                    logger.debug(f"Added state '{target_state}' to new unit {source_unit_id} from source")
+                target_units.append(new_unit)
+                units_by_id[source_unit_id] = new_unit
     
     return updated_content
 
 
+def _index_units_by_id(file_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the translation units of one XLIFF file by ID.
+    
+    Units without an ID are skipped; if an ID repeats, the first unit wins.
+    
+    Args:
+        file_data: One entry of the ``files`` list of XLIFF content
+        
+    Returns:
+        Dictionary mapping unit ID to unit, in document order
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for unit in file_data.get('trans-units', ()):
+        unit_id = unit.get('id')
+        if unit_id and unit_id not in index:
+            index[unit_id] = unit
+    return index
+
+
 def _extract_full_text_from_element(element: ET.Element) -> str:
     """
     Extract full text content from an XML element including all child elements.
@@ -394,148 +477,180 @@ def _extract_full_text_from_element(element: ET.Element) -> str:
     if element is None:
         return ''
     
+    # Plain text without inline codes is by far the most common case
+    if len(element) == 0:
+        return (element.text or '').strip()
+    
+    # Serialize inline codes without the document namespace (<ph .../> rather
+    # than <ns0:ph xmlns:ns0="..." .../>); one pass covers all nested children
+    for node in element.iter():
+        if node is not element and isinstance(node.tag, str) and node.tag.startswith('{'):
+            node.tag = node.tag.split('}', 1)[1]
+    
     # Start with direct text content
-    text_parts = []
-    if element.text:
-        text_parts.append(element.text)
+    text_parts = [element.text or '']
     
     # Process all child elements
     for child in element:
         # For XLIFF-specific tags, preserve them as XML strings
-        # This allows placeholders to be detected and validated
-        child_xml = ET.tostring(child, encoding='unicode')
-        text_parts.append(child_xml)
+        # This allows placeholders to be detected and validated.
+        # The tail is left out, since ET.tostring would otherwise include it
+        # escaped, and is added as plain text below like element.text
+        tail = child.tail
+        child.tail = None
+        text_parts.append(ET.tostring(child, encoding='unicode'))
+        child.tail = tail
         
         # Add tail text after child
-        if child.tail:
-            text_parts.append(child.tail)
+        if tail:
+            text_parts.append(tail)
     
     return ''.join(text_parts).strip()
 
 
-def _parse_xliff_root(root: ET.Element) -> Dict[str, Any]:
+def _xliff_tags(root: ET.Element) -> Dict[str, str]:
+    """Return the XLIFF tag names qualified with the namespace of ``root``."""
+    namespace = root.tag[1:].split('}', 1)[0] if root.tag.startswith('{') else ''
+    tags = _XLIFF_TAGS_BY_NAMESPACE.get(namespace)
+    if tags is None:
+        tags = _qualify_tags(namespace)
+    return tags
+
+
+def _parse_xliff_stream(source) -> Optional[Dict[str, Any]]:
     """
-    Parse XLIFF root element into a dictionary.
+    Parse an XLIFF document into a dictionary.
     Supports both XLIFF 1.2 and 2.0 formats.
     
+    The document is read incrementally: each unit is converted as soon as its
+    end tag is parsed, then cleared and removed from its parent, so the
+    partial tree only holds the elements that are still open. The returned
+    dictionary still grows with the number of units.
+    
     Args:
-        root: XLIFF root element
+        source: Binary file object positioned at the start of the document
         
     Returns:
-        Dictionary representation of XLIFF content
-    """
-    version = root.get('version', '1.2')
-    result = {
-        'version': version,
-        'files': []
-    }
-    
-    # Determine namespace based on version
-    if version == '2.0':
-        namespace = 'urn:oasis:names:tc:xliff:document:2.0'
-    else:
-        namespace = 'urn:oasis:names:tc:xliff:document:1.2'
-    
-    # Get source language from root (XLIFF 2.0) or from file element (XLIFF 1.2)
-    source_lang = root.get('srcLang') or root.get('source-language', '')
-    
-    # Parse file elements (handle both with and without namespace)
-    file_elements = root.findall('.//file') or root.findall(f'.//{{{namespace}}}file')
-    
-    for file_elem in file_elements:
-        # XLIFF 2.0 uses srcLang on root, 1.2 uses source-language on file
-        file_source_lang = file_elem.get('source-language') or source_lang
-        file_data = {
-            'original': file_elem.get('original', ''),
-            'source-language': file_source_lang,
-            'target-language': file_elem.get('target-language', ''),
-            'datatype': file_elem.get('datatype', 'plaintext'),
-            'trans-units': []
-        }
+        Dictionary representation of XLIFF content, or None if the root
+        element is not <xliff>
         
-        if version == '2.0':
-            # XLIFF 2.0: <unit> with <segment> containing <source>/<target>
-            units = file_elem.findall('.//unit') or file_elem.findall(f'.//{{{namespace}}}unit')
-            
-            for unit in units:
-                unit_data = {
-                    'id': unit.get('id', ''),
-                    'source': '',
-                    'target': ''
-                }
-                
-                # Find segment element
-                segment = unit.find('segment') or unit.find(f'{{{namespace}}}segment')
-                if segment is not None:
-                    # Find source and target within segment
-                    source_elem = segment.find('source') or segment.find(f'{{{namespace}}}source')
-                    if source_elem is not None:
-                        unit_data['source'] = _extract_full_text_from_element(source_elem)
-                    
-                    target_elem = segment.find('target') or segment.find(f'{{{namespace}}}target')
-                    if target_elem is not None:
-                        unit_data['target'] = _extract_full_text_from_element(target_elem)
-                    
-                    # For XLIFF 2.0, state is on segment, not target
-                    state_attr = segment.get('state')
-                    if state_attr:
-                        unit_data['state'] = state_attr
-                    else:
-                        # Fallback: check target for state (for compatibility)
-                        if target_elem is not None:
-                            target_state_attr = target_elem.get('state')
-                            if target_state_attr:
-                                unit_data['state'] = target_state_attr
-                else:
-                    # Fallback: look for source/target directly in unit
-                    source_elem = unit.find('source') or unit.find(f'{{{namespace}}}source')
-                    if source_elem is not None:
-                        unit_data['source'] = _extract_full_text_from_element(source_elem)
-                    
-                    target_elem = unit.find('target') or unit.find(f'{{{namespace}}}target')
-                    if target_elem is not None:
-                        unit_data['target'] = _extract_full_text_from_element(target_elem)
-                        # Preserve state attribute if present (check for both None and empty string)
-                        state_attr = target_elem.get('state')
-                        if state_attr:
-                            unit_data['state'] = state_attr
-                
-                file_data['trans-units'].append(unit_data)
+    Raises:
+        ET.ParseError: If the document is not well-formed XML
+    """
+    result = None
+    tags: Dict[str, str] = {}
+    unit_tag = ''
+    parse_unit = _parse_xliff_1_2_unit
+    source_lang = ''
+    file_data = None
+    open_elements = []  # Elements whose end tag has not been parsed yet, root first
+    
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            open_elements.append(elem)
         else:
-            # XLIFF 1.2: <trans-unit> with <source>/<target> in <body>
-            trans_units = file_elem.findall('.//trans-unit') or file_elem.findall(f'.//{{{namespace}}}trans-unit')
-            
-            for trans_unit in trans_units:
-                unit_data = {
-                    'id': trans_unit.get('id', ''),
-                    'source': '',
-                    'target': ''
-                }
-                
-                # Find source and target elements (handle both with and without namespace)
-                source_elem = trans_unit.find('source') or trans_unit.find(f'{{{namespace}}}source')
-                if source_elem is not None:
-                    unit_data['source'] = _extract_full_text_from_element(source_elem)
-                
-                target_elem = trans_unit.find('target') or trans_unit.find(f'{{{namespace}}}target')
-                if target_elem is not None:
-                    unit_data['target'] = _extract_full_text_from_element(target_elem)
-                    # Preserve state attribute if present (check for both None and empty string)
-                    state_attr = target_elem.get('state')
-                    if state_attr:
-                        unit_data['state'] = state_attr
-                
-                file_data['trans-units'].append(unit_data)
+            open_elements.pop()
         
-        result['files'].append(file_data)
+        if result is None:
+            # First event is the start of the root element
+            if elem.tag != 'xliff' and not elem.tag.endswith('}xliff'):
+                return None
+            version = elem.get('version', '1.2')
+            result = {
+                'version': version,
+                'files': []
+            }
+            # Tag names qualified with the document's namespace (if any), resolved once
+            tags = _xliff_tags(elem)
+            # XLIFF 2.0: <unit> with <segment>; XLIFF 1.2: <trans-unit> in <body>.
+            # The version decides once which units to collect and how to convert them
+            if version == '2.0':
+                unit_tag, parse_unit = tags['unit'], _parse_xliff_2_0_unit
+            else:
+                unit_tag, parse_unit = tags['trans-unit'], _parse_xliff_1_2_unit
+            # Get source language from root (XLIFF 2.0) or from file element (XLIFF 1.2)
+            source_lang = elem.get('srcLang') or elem.get('source-language', '')
+        elif elem.tag == tags['file']:
+            if event == 'start':
+                # XLIFF 2.0 uses srcLang on root, 1.2 uses source-language on file
+                file_data = {
+                    'original': elem.get('original', ''),
+                    'source-language': elem.get('source-language') or source_lang,
+                    'target-language': elem.get('target-language', ''),
+                    'datatype': elem.get('datatype', 'plaintext'),
+                    'trans-units': []
+                }
+                result['files'].append(file_data)
+            else:
+                file_data = None
+                elem.clear()
+                if open_elements:
+                    open_elements[-1].remove(elem)
+        elif event == 'end' and elem.tag == unit_tag:
+            if file_data is not None:
+                file_data['trans-units'].append(parse_unit(elem, tags))
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
     
     return result
 
 
+def _parse_xliff_1_2_unit(unit: ET.Element, tags: Dict[str, str]) -> Dict[str, str]:
+    """Convert an XLIFF 1.2 <trans-unit> element; its state is kept on <target>."""
+    return _xliff_unit_data(unit, unit, tags)
+
+
+def _parse_xliff_2_0_unit(unit: ET.Element, tags: Dict[str, str]) -> Dict[str, str]:
+    """Convert an XLIFF 2.0 <unit> element; source, target and state live on its <segment>."""
+    segment = unit.find(tags['segment'])
+    if segment is None:
+        # Units without a segment keep source/target directly under the unit
+        return _xliff_unit_data(unit, unit, tags)
+    return _xliff_unit_data(unit, segment, tags, segment.get('state'))
+
+
+def _xliff_unit_data(unit: ET.Element, container: ET.Element, tags: Dict[str, str],
+                     state: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build the dictionary for one translation unit.
+    
+    Args:
+        unit: Unit element, fully parsed
+        container: Element holding <source> and <target> (the unit or its segment)
+        tags: XLIFF tag names qualified with the document's namespace
+        state: State found on the segment (XLIFF 2.0), if any
+        
+    Returns:
+        Dictionary with 'id', 'source', 'target' and, if present, 'state'
+    """
+    source_elem = container.find(tags['source'])
+    target_elem = container.find(tags['target'])
+    
+    unit_data = {
+        'id': unit.get('id', ''),
+        'source': _extract_full_text_from_element(source_elem),
+        'target': _extract_full_text_from_element(target_elem)
+    }
+    
+    # XLIFF 1.2 (and older 2.0 files) keep state on target.
+    # Only preserve a non-empty state attribute
+    if not state and target_elem is not None:
+        state = target_elem.get('state')
+    if state:
+        unit_data['state'] = state
+    
+    return unit_data
+
+
 def is_valid_xliff_file(file_path: str) -> bool:
     """
     Check if a file is a valid XLIFF file.
     
+    The file is an XLIFF file if it is well-formed XML whose root element is
+    <xliff>. The whole document is parsed, but elements are discarded as soon
+    as they end and no units are collected.
+    
     Args:
         file_path: Path to the file to check
         
@@ -543,9 +658,16 @@ def is_valid_xliff_file(file_path: str) -> bool:
         True if the file is a valid XLIFF file, False otherwise
     """
     try:
-        content = read_xliff_file(file_path)
-        return 'files' in content and isinstance(content['files'], list)
-    except (FileNotFoundError, ValueError, ET.ParseError):
+        with open(file_path, 'rb') as f:
+            context = ET.iterparse(f, events=('start', 'end'))
+            _, root = next(context)
+            if root.tag.rsplit('}', 1)[-1] != 'xliff':
+                return False
+            for event, elem in context:
+                if event == 'end':
+                    elem.clear()
+        return True
+    except (OSError, ET.ParseError):
         return False
 
 
@@ -560,24 +682,47 @@ def get_xliff_language_code(file_path: str) -> Optional[str]:
         Language code if found, None otherwise
     """
     # Try to extract from filename (e.g., messages.en.xlf -> en, messages.en_US.xlf -> en_US)
-    filename = os.path.basename(file_path)
-    if '.' in filename:
-        parts = filename.split('.')
-        if len(parts) >= 3:  # messages.en.xlf or messages.en_US.xlf
-            potential_lang = parts[-2]
-            if len(potential_lang) == 2 or len(potential_lang) == 5:  # en or en_US
-                return potential_lang
-            # Handle cases like messages.en_US.xlf where we need to check for underscore
-            elif '_' in potential_lang and len(potential_lang) == 5:  # en_US format
-                return potential_lang
-    
-    # Try to extract from XLIFF content
+    match = _FILENAME_LANG_RE.search(os.path.basename(file_path))
+    if match:
+        return match.group(1)
+    
+    # Try to extract from XLIFF content: the first <file> element is enough
     try:
-        content = read_xliff_file(file_path)
-        if 'files' in content and content['files']:
-            file_data = content['files'][0]
-            return file_data.get('target-language')
-    except (ValueError, ET.ParseError, FileNotFoundError):
+        file_elem = _find_xliff_start_element(file_path, 'file')
+        if file_elem is not None:
+            return file_elem.get('target-language', '')
+    except (OSError, ET.ParseError):
         pass
     
     return None
+
+
+def _find_xliff_start_element(file_path: str, tag_name: str) -> Optional[ET.Element]:
+    """
+    Return the first element named ``tag_name`` in an XLIFF document.
+    
+    The document is parsed only up to that element's start tag, so only its
+    attributes are available; its children may not have been read yet.
+    
+    Args:
+        file_path: Path to the XLIFF file
+        tag_name: Local tag name (without namespace) to look for
+        
+    Returns:
+        The element, or None if the root element is not <xliff> or no such
+        element exists
+        
+    Raises:
+        OSError: If the file cannot be opened
+        ET.ParseError: If the XML before the element is not well-formed
+    """
+    with open(file_path, 'rb') as f:
+        is_root = True
+        for _, elem in ET.iterparse(f, events=('start',)):
+            local_name = elem.tag.rsplit('}', 1)[-1]
+            if is_root and local_name != 'xliff':
+                return None
+            is_root = False
+            if local_name == tag_name:
+                return elem
+    return None
@@ -3,17 +3,18 @@ XLSX translation file handler for multi-language translations
 """
 
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union, IO
 from pathlib import Path
 from openpyxl import load_workbook, Workbook
 
 
-def read_xlsx_file(file_path: str) -> Dict[str, Any]:
+def read_xlsx_file(file_path: Union[str, os.PathLike, IO[bytes]]) -> Dict[str, Any]:
     """
     Read an XLSX translation file and return its content as a dictionary.
     
     Args:
-        file_path: Path to the XLSX file
+        file_path: Path to the XLSX file, or a binary file object
+            (e.g. ``io.BytesIO``) that is read without touching the disk
         
     Returns:
         Dictionary containing the XLSX file content with language columns
@@ -22,66 +23,69 @@ def read_xlsx_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file is not valid XLSX format
     """
-    if not os.path.exists(file_path):
+    if not hasattr(file_path, 'read') and not os.path.exists(file_path):
         raise FileNotFoundError(f"XLSX file not found: {file_path}")
     
     try:
         wb = load_workbook(filename=file_path, read_only=True, data_only=True)
-        ws = wb.active
-        
-        if ws is None:
-            raise ValueError(f"No active worksheet found in XLSX file {file_path}")
-        
-        # Get all rows as a list
-        rows = list(ws.iter_rows(values_only=True))
-        wb.close()
-        
-        if not rows:
-            raise ValueError(f"XLSX file {file_path} is empty")
-        
-        # First row should be headers
-        headers = [_safe_cell_value(cell) for cell in rows[0]]
-        if len(headers) < 2:
-            raise ValueError(f"XLSX file {file_path} must have at least 2 columns (key and at least one language)")
-        
-        # First column is the key, rest are language codes
-        key_column = headers[0]
-        language_columns = headers[1:]
-        
-        # Validate language codes
-        for lang in language_columns:
-            if not lang or not str(lang).strip():
-                raise ValueError(f"Empty language code found in header: {headers}")
-        
-        # Parse data rows
-        translations = {}
-        for row in rows[1:]:
-            if not row:  # Skip empty rows
-                continue
+        try:
+            ws = wb.active
             
-            # Convert all cells to safe values
-            safe_row = [_safe_cell_value(cell) for cell in row]
+            if ws is None:
+                raise ValueError(f"No active worksheet found in XLSX file {file_path}")
             
-            # Skip completely empty rows
-            if all(not cell for cell in safe_row):
-                continue
+            # Rows are streamed from the sheet instead of being loaded into a list
+            rows = ws.iter_rows(values_only=True)
+            header_row = next(rows, None)
             
-            if len(safe_row) != len(headers):
-                continue  # Skip malformed rows
+            if header_row is None:
+                raise ValueError(f"XLSX file {file_path} is empty")
             
-            key = safe_row[0].strip() if safe_row[0] else ""
-            if not key:
-                continue  # Skip rows without keys
+            # First row should be headers
+            headers = [_safe_cell_value(cell) for cell in header_row]
+            if len(headers) < 2:
+                raise ValueError(f"XLSX file {file_path} must have at least 2 columns (key and at least one language)")
             
-            # Create language translations
-            lang_translations = {}
-            for i, lang in enumerate(language_columns):
-                value = safe_row[i + 1].strip() if i + 1 < len(safe_row) and safe_row[i + 1] else ""
-                if value:  # Only include non-empty translations
-                    lang_translations[lang] = value
+            # First column is the key, rest are language codes
+            key_column = headers[0]
+            language_columns = headers[1:]
             
-            if lang_translations:  # Only include keys with at least one translation
-                translations[key] = lang_translations
+            # Validate language codes
+            for lang in language_columns:
+                if not lang or not str(lang).strip():
+                    raise ValueError(f"Empty language code found in header: {headers}")
+            
+            # Parse data rows
+            translations = {}
+            for row in rows:
+                if not row:  # Skip empty rows
+                    continue
+                
+                # Convert all cells to safe values
+                safe_row = [_safe_cell_value(cell) for cell in row]
+                
+                # Skip completely empty rows
+                if all(not cell for cell in safe_row):
+                    continue
+                
+                if len(safe_row) != len(headers):
+                    continue  # Skip malformed rows
+                
+                key = safe_row[0].strip() if safe_row[0] else ""
+                if not key:
+                    continue  # Skip rows without keys
+                
+                # Create language translations
+                lang_translations = {}
+                for i, lang in enumerate(language_columns):
+                    value = safe_row[i + 1].strip() if i + 1 < len(safe_row) and safe_row[i + 1] else ""
+                    if value:  # Only include non-empty translations
+                        lang_translations[lang] = value
+                
+                if lang_translations:  # Only include keys with at least one translation
+                    translations[key] = lang_translations
+        finally:
+            wb.close()
         
         return {
             'key_column': key_column,
@@ -93,12 +97,13 @@ def read_xlsx_file(file_path: str) -> Dict[str, Any]:
         raise ValueError(f"Failed to parse XLSX file {file_path}: {str(e)}")
 
 
-def write_xlsx_file(file_path: str, content: Dict[str, Any]) -> None:
+def write_xlsx_file(file_path: Union[str, os.PathLike, IO[bytes]], content: Dict[str, Any]) -> None:
     """
     Write content to an XLSX translation file.
     
     Args:
-        file_path: Path where to write the XLSX file
+        file_path: Path where to write the XLSX file, or a binary file object
+            (e.g. ``io.BytesIO``) to write the workbook to
         content: Dictionary containing the XLSX content
         
     Raises:
@@ -111,7 +116,8 @@ def write_xlsx_file(file_path: str, content: Dict[str, Any]) -> None:
         raise ValueError("XLSX content must contain 'translations' and 'languages' keys")
     
     # Ensure the directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if not hasattr(file_path, 'write') and os.path.dirname(file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
     
     key_column = content.get('key_column', 'key')
     languages = content['languages']
@@ -234,12 +240,12 @@ def get_xlsx_language_codes(xlsx_content: Dict[str, Any]) -> List[str]:
     return xlsx_content.get('languages', [])
 
 
-def is_valid_xlsx_file(file_path: str) -> bool:
+def is_valid_xlsx_file(file_path: Union[str, os.PathLike, IO[bytes]]) -> bool:
     """
     Check if a file is a valid XLSX translation file.
     
     Args:
-        file_path: Path to the file to check
+        file_path: Path to the file to check, or a binary file object
         
     Returns:
         True if the file is a valid XLSX file, False otherwise
@@ -267,12 +273,12 @@ def get_xlsx_language_code(file_path: str) -> Optional[str]:
     return None
 
 
-def is_glossary_xlsx(file_path: str) -> bool:
+def is_glossary_xlsx(file_path: Union[str, os.PathLike, IO[bytes]]) -> bool:
     """
     Check if an XLSX file is a glossary file (vs translation file).
     
     Args:
-        file_path: Path to the XLSX file
+        file_path: Path to the XLSX file, or a binary file object
         
     Returns:
         True if the file appears to be a glossary file, False otherwise
@@ -285,14 +291,14 @@ def is_glossary_xlsx(file_path: str) -> bool:
             wb.close()
             return False
         
-        # Get first row
-        rows = list(ws.iter_rows(values_only=True))
+        # Only the header row is needed
+        header_row = next(ws.iter_rows(max_row=1, values_only=True), None)
         wb.close()
         
-        if not rows:
+        if not header_row:
             return False
         
-        headers = [_safe_cell_value(cell) for cell in rows[0]]
+        headers = [_safe_cell_value(cell) for cell in header_row]
         
         # Glossary files typically have "Record ID" as first column
         # Translation files typically have "key" as first column
@@ -4,7 +4,7 @@ from unittest.mock import patch, Mock, call
 
 from colorama import Fore
 
-from algebras.commands.update_command import execute
+from algebras.commands.update_command import execute, identify_translation_issues
 
 
 class TestUpdateCommand(unittest.TestCase):
@@ -128,7 +128,7 @@ class TestUpdateCommand(unittest.TestCase):
     @patch('algebras.commands.update_command.FileScanner')
     @patch('algebras.commands.update_command.is_git_available')
     @patch('algebras.commands.update_command.is_git_repository')
-    @patch('algebras.commands.update_command.validate_language_files')
+    @patch('algebras.commands.update_command.validate_all_targets')
     @patch('algebras.commands.update_command.find_outdated_keys')
     @patch('algebras.commands.update_command.translate_command')
     @patch('os.path.getmtime')
@@ -155,7 +155,7 @@ class TestUpdateCommand(unittest.TestCase):
         mock_getmtime.side_effect = lambda file: 200 if file == self.en_file else 100
         
         # Mock validation results (fr has missing keys, es is valid)
-        mock_validate.side_effect = [
+        mock_validate.return_value = [
             (False, self.missing_keys),  # fr file
             (True, set()),             # es file
             (True, set())              # de file
@@ -204,7 +204,7 @@ class TestUpdateCommand(unittest.TestCase):
     @patch('algebras.commands.update_command.FileScanner')
     @patch('algebras.commands.update_command.is_git_available')
     @patch('algebras.commands.update_command.is_git_repository')
-    @patch('algebras.commands.update_command.validate_language_files')
+    @patch('algebras.commands.update_command.validate_all_targets')
     @patch('algebras.commands.update_command.find_outdated_keys')
     @patch('algebras.commands.update_command.translate_command')
     @patch('os.path.getmtime')
@@ -231,7 +231,7 @@ class TestUpdateCommand(unittest.TestCase):
         mock_getmtime.side_effect = lambda file: 100  # All files have the same mtime
         
         # Mock validation results
-        mock_validate.return_value = (True, set())  # No missing keys
+        mock_validate.side_effect = lambda source_file, target_files: [(True, set())] * len(target_files)  # No missing keys
         
         # Unused in this test since git is not available
         mock_find_outdated.return_value = (False, set())
@@ -255,7 +255,7 @@ class TestUpdateCommand(unittest.TestCase):
     @patch('algebras.commands.update_command.FileScanner')
     @patch('algebras.commands.update_command.is_git_available')
     @patch('algebras.commands.update_command.is_git_repository')
-    @patch('algebras.commands.update_command.validate_language_files')
+    @patch('algebras.commands.update_command.validate_all_targets')
     @patch('algebras.commands.update_command.find_outdated_keys')
     @patch('algebras.commands.update_command.translate_command')
     @patch('os.path.getmtime')
@@ -282,7 +282,7 @@ class TestUpdateCommand(unittest.TestCase):
         mock_getmtime.side_effect = lambda file: 200 if file == self.en_file else 100
         
         # Mock validation results
-        mock_validate.return_value = (False, self.missing_keys)
+        mock_validate.side_effect = lambda source_file, target_files: [(False, self.missing_keys)] * len(target_files)
         
         # Mock git outdated keys detection
         mock_find_outdated.return_value = (True, {"navbar.login"})
@@ -306,6 +306,39 @@ class TestUpdateCommand(unittest.TestCase):
             
             assert language_called, "Language 'fr' wasn't passed to translate_command.execute"
 
+    @patch('algebras.commands.update_command.is_git_available', return_value=True)
+    @patch('algebras.commands.update_command.is_git_repository')
+    @patch('algebras.commands.update_command.validate_all_targets')
+    @patch('algebras.commands.update_command.find_outdated_keys', return_value=(False, set()))
+    def test_identify_translation_issues_concurrent_validates_checked_pairs(self, mock_find_outdated,
+                                                                            mock_validate, mock_is_git_repo,
+                                                                            mock_is_git_available):
+        # The second source lives outside any git repository, so its pair is skipped
+        other_en_file = "other/en/messages.json"
+        other_fr_file = "other/fr/messages.json"
+        files_by_language = {
+            "en": [self.en_file, other_en_file],
+            "fr": [self.fr_file, other_fr_file],
+            "es": [self.es_file],
+        }
+        mock_is_git_repo.side_effect = lambda path: path == "locales"
+        mock_validate.side_effect = lambda source_file, target_files: [(False, self.missing_keys)] * len(target_files)
+        
+        with patch('algebras.commands.update_command.click.echo'):
+            _, missing_keys_by_language, _ = identify_translation_issues(
+                ["fr", "es"], "en", files_by_language,
+                check_modification_time=False,
+                concurrent_processing=True
+            )
+        
+        # One validation per source, covering only the pairs that were checked
+        mock_validate.assert_called_once()
+        source_file, target_files = mock_validate.call_args[0]
+        self.assertEqual(source_file, self.en_file)
+        self.assertEqual(sorted(target_files), sorted([self.fr_file, self.es_file]))
+        self.assertEqual(missing_keys_by_language["fr"], [(self.fr_file, self.missing_keys, self.en_file)])
+        self.assertEqual(missing_keys_by_language["es"], [(self.es_file, self.missing_keys, self.en_file)])
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -5,6 +5,8 @@ Integration tests for CSV translation
 import os
 import tempfile
 import pytest
+from unittest.mock import Mock
+from algebras.services.strategies.csv_strategy import CsvTranslationStrategy
 from algebras.utils.csv_handler import (
     read_csv_file, write_csv_file, extract_translatable_strings,
     create_csv_from_translations, add_language_to_csv, get_csv_language_codes,
@@ -148,3 +150,25 @@ language.selection,Select Language,Sprache auswählen,Sélectionner la langue
         
         result = get_csv_language_codes(csv_content)
         assert result == ['en', 'de', 'fr', 'es']
+    
+    def test_csv_strategy_translates_repeated_strings_once(self):
+        """Test that rows sharing a source string are translated once."""
+        strategy = CsvTranslationStrategy(Mock(), Mock(), Mock(), 10, {})
+        strategy._flat_strategy = Mock()
+        strategy._flat_strategy.translate.return_value = {'ok.button': 'Fertig', 'cancel.button': 'Abbrechen'}
+        csv_content = {
+            'translations': {
+                'ok.button': {'en': 'OK'},
+                'cancel.button': {'en': 'Cancel'},
+                'dialog.ok': {'en': 'OK'},
+            }
+        }
+        
+        result = strategy.translate(csv_content, 'en', 'de')
+        
+        assert strategy._flat_strategy.translate.call_args[0][0] == {'ok.button': 'OK', 'cancel.button': 'Cancel'}
+        assert result['translations']['ok.button']['de'] == 'Fertig'
+        assert result['translations']['dialog.ok']['de'] == 'Fertig'
+        assert result['translations']['cancel.button']['de'] == 'Abbrechen'
+        # The input content is left untouched
+        assert csv_content['translations']['ok.button'] == {'en': 'OK'}
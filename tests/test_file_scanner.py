@@ -2,13 +2,14 @@
 Tests for the FileScanner class
 """
 
+import glob
 import os
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from algebras.config import Config
-from algebras.services.file_scanner import FileScanner
+from algebras.services.file_scanner import FileScanner, _walk_files_with_suffixes
 
 
 class TestFileScanner:
@@ -60,13 +61,17 @@ class TestFileScanner:
         ]
 
         def mock_glob(pattern, recursive=False):
-            if pattern == "**/*.json":
-                return file_paths
-            elif pattern == "**/node_modules/**":
+            if pattern == "**/node_modules/**":
                 return ["node_modules/package/en.json"]
             return []
 
+        # "**/*.ext" patterns are served by one directory walk instead of glob
+        def mock_walk(suffixes):
+            assert ".json" in suffixes
+            return file_paths
+
         monkeypatch.setattr("glob.glob", mock_glob)
+        monkeypatch.setattr("algebras.services.file_scanner._walk_files_with_suffixes", mock_walk)
         monkeypatch.setattr("os.path.isfile", lambda x: True)
         monkeypatch.setattr("os.path.normpath", lambda x: x)
 
@@ -92,6 +97,36 @@ class TestFileScanner:
         assert "locales/en.json" in result
         assert "node_modules/package/en.json" not in result
 
+    def test_walk_files_with_suffixes_matches_recursive_glob(self, tmp_path, monkeypatch):
+        """Test that the single directory walk finds the same files as '**/*.ext' globs"""
+        for rel_path in [
+            "messages.en.xlf",
+            "translations/messages.fr.xlf",
+            "translations/nested/app.po",
+            "translations/readme.txt",
+            ".hidden/skipped.xlf",
+            "translations/.skipped.xlf",
+            "dir.xlf/inner.txt",
+        ]:
+            path = tmp_path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("test", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        expected = {
+            os.path.normpath(file_path)
+            for pattern in ("**/*.xlf", "**/*.po")
+            for file_path in glob.glob(pattern, recursive=True)
+            if os.path.isfile(file_path)
+        }
+        found = {os.path.normpath(file_path) for file_path in _walk_files_with_suffixes((".xlf", ".po"))}
+
+        assert found == expected == {
+            "messages.en.xlf",
+            os.path.join("translations", "messages.fr.xlf"),
+            os.path.join("translations", "nested", "app.po"),
+        }
+
     def test_group_files_by_language(self, monkeypatch):
         """Test group_files_by_language method"""
         # Mock find_localization_files to return a list of file paths
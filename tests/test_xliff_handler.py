@@ -2,23 +2,23 @@
 Tests for XLIFF handler
 """
 
+import copy
+import io
 import os
-import tempfile
+import stat
 import xml.etree.ElementTree as ET
 import pytest
+from unittest.mock import patch
 from algebras.utils.xliff_handler import (
     read_xliff_file, write_xliff_file, extract_translatable_strings,
     create_xliff_from_translations, is_valid_xliff_file, get_xliff_language_code,
-    update_xliff_targets
+    update_xliff_targets, _index_units_by_id
 )
 
+XLIFF_1_2_NS = 'urn:oasis:names:tc:xliff:document:1.2'
 
-class TestXLIFFHandler:
-    """Test cases for XLIFF handler functions."""
-    
-    def test_read_xliff_file(self):
-        """Test reading XLIFF files."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
+
+XLIFF_1_2_SAMPLE = b'''<?xml version="1.0" encoding="UTF-8" ?>
 <xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
   <file original="messages" source-language="en" target-language="en" datatype="plaintext">
     <body>
@@ -33,38 +33,240 @@ class TestXLIFFHandler:
     </body>
   </file>
 </xliff>'''
+
+XLIFF_1_2_DE_SAMPLE = b'''<?xml version="1.0" encoding="UTF-8" ?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+  <file original="messages" source-language="en" target-language="de" datatype="plaintext">
+    <body>
+      <trans-unit id="app.title">
+        <source>My App</source>
+        <target>Meine App</target>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>'''
+
+XLIFF_2_0_SAMPLE = b'''<?xml version="1.0" encoding="UTF-8" ?>
+<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en-US">
+  <file id="ngi18n" original="ng.template">
+    <unit id="6439365426343089851">
+      <segment>
+        <source>General</source>
+      </segment>
+    </unit>
+    <unit id="6812930637022637485">
+      <segment>
+        <source>Display</source>
+        <target>Affichage</target>
+      </segment>
+    </unit>
+  </file>
+</xliff>'''
+
+XLIFF_2_0_WITH_STATE_SAMPLE = '''<?xml version="1.0" encoding="UTF-8" ?>
+<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en-US">
+  <file id="ngi18n" original="ng.template">
+    <unit id="6439365426343089851">
+      <segment>
+        <source>General</source>
+        <target state="needs-review-translation">Général</target>
+      </segment>
+    </unit>
+  </file>
+</xliff>'''.encode('utf-8')
+
+XLIFF_1_2_PARTIAL_STATE_SAMPLE = b'''<?xml version="1.0" encoding="UTF-8" ?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+  <file source-language="en" target-language="es">
+    <body>
+      <trans-unit id="key1">
+        <source>Hello</source>
+        <target>Hola</target>
+      </trans-unit>
+      <trans-unit id="key2">
+        <source>World</source>
+        <target state="needs-review">Mundo</target>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>'''
+
+
+def _xliff(version, units, **file_attrs):
+    """Build XLIFF content with a single file holding ``units``."""
+    return {'version': version, 'files': [{**file_attrs, 'trans-units': units}]}
+
+
+UPDATE_XLIFF_TARGETS_CASES = [
+    pytest.param(
+        _xliff('2.0', [
+            {'id': '1009606887419612072', 'source': 'Patient management', 'target': ''},
+            {'id': '6439365426343089851', 'source': 'General', 'target': 'Tổng quát'},
+        ], **{'original': 'messages', 'source-language': 'en', 'target-language': 'vi'}),
+        {
+            '1009606887419612072': 'Quản lý bệnh nhân',
+            '6439365426343089851': 'Tổng quát mới',  # Update existing translation
+        },
+        None, None,
+        {
+            '1009606887419612072': {'source': 'Patient management', 'target': 'Quản lý bệnh nhân'},
+            '6439365426343089851': {'source': 'General', 'target': 'Tổng quát mới'},
+        },
+        id="updates_targets",
+    ),
+    pytest.param(
+        _xliff('1.2', [
+            {'id': 'key1', 'source': 'Source 1', 'target': 'Target 1'},
+            {'id': 'key2', 'source': 'Source 2', 'target': ''},
+            {'id': 'key3', 'source': 'Source 3', 'target': 'Target 3'},
+        ]),
+        {'key2': 'New Target 2'},
+        None, None,
+        {
+            'key1': {'source': 'Source 1', 'target': 'Target 1'},
+            'key2': {'source': 'Source 2', 'target': 'New Target 2'},
+            'key3': {'source': 'Source 3', 'target': 'Target 3'},
+        },
+        id="preserves_untranslated",
+    ),
+    pytest.param(
+        _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': ''}]),
+        {'key1': 'Bonjour'},
+        None, None,
+        {'key1': {'source': 'Hello', 'target': 'Bonjour'}},
+        id="with_empty_target",
+    ),
+    pytest.param(
+        # Should keep target empty (not use source) when no translation provided,
+        # which makes missing translations more visible
+        _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': ''}]),
+        {},
+        None, None,
+        {'key1': {'source': 'Hello', 'target': ''}},
+        id="handles_missing_translation",
+    ),
+    pytest.param(
+        # State should NOT be set for existing units, only for new units from source
+        _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': ''}]),
+        {'key1': 'Hola'},
+        None, "needs-review-translation",
+        {'key1': {'source': 'Hello', 'target': 'Hola'}},
+        id="updates_target_without_state_for_existing_units",
+    ),
+    pytest.param(
+        # Different state is passed, but the existing state is preserved
+        _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': 'Hola', 'state': 'final'}]),
+        {'key1': 'Hola Updated'},
+        None, "needs-review-translation",
+        {'key1': {'source': 'Hello', 'target': 'Hola Updated', 'state': 'final'}},
+        id="preserves_existing_state",
+    ),
+    pytest.param(
+        # Only key2 is being translated; no existing unit gets a state
+        _xliff('1.2', [
+            {'id': 'key1', 'source': 'Hello', 'target': 'Hola'},
+            {'id': 'key2', 'source': 'World', 'target': ''},
+            {'id': 'key3', 'source': 'Test', 'target': 'Prueba'},
+        ]),
+        {'key2': 'Mundo'},
+        None, "needs-review",
+        {
+            'key1': {'source': 'Hello', 'target': 'Hola'},
+            'key2': {'source': 'World', 'target': 'Mundo'},
+            'key3': {'source': 'Test', 'target': 'Prueba'},
+        },
+        id="sets_state_only_for_translated_keys",
+    ),
+    pytest.param(
+        _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': 'Hola'}]),
+        {'key2': 'Mundo'},
+        _xliff('1.2', [
+            {'id': 'key1', 'source': 'Hello', 'target': 'Hello'},
+            {'id': 'key2', 'source': 'World', 'target': 'World'},
+        ]),
+        "needs-review",
+        {
+            # key1: existing unit, not in translations, should NOT get state
+            'key1': {'source': 'Hello', 'target': 'Hola'},
+            # key2: new unit from source, in translations, should get state
+            'key2': {'source': 'World', 'target': 'Mundo', 'state': 'needs-review'},
+        },
+        id="sets_state_for_new_units_from_source",
+    ),
+    pytest.param(
+        # Re-run with nothing missing: every source unit is already in target
+        _xliff('1.2', [
+            {'id': 'key1', 'source': 'Hello', 'target': 'Hola'},
+            {'id': 'key2', 'source': 'World', 'target': 'Mundo', 'state': 'translated'},
+        ]),
+        {},
+        _xliff('1.2', [
+            {'id': 'key1', 'source': 'Hello', 'target': 'Hello'},
+            {'id': 'key2', 'source': 'World', 'target': 'World'},
+        ]),
+        "needs-review",
+        {
+            'key1': {'source': 'Hello', 'target': 'Hola'},
+            'key2': {'source': 'World', 'target': 'Mundo', 'state': 'translated'},
+        },
+        id="leaves_fully_translated_target_unchanged",
+    ),
+]
+
+
+@pytest.fixture(scope="class")
+def xliff_dir(tmp_path_factory):
+    """Scratch directory shared by the tests of a class; pytest removes it."""
+    return tmp_path_factory.mktemp('xliff', numbered=True)
+
+
+class TestXLIFFHandler:
+    """Test cases for XLIFF handler functions."""
+    
+    def test_read_xliff_file(self, xliff_dir):
+        """Test reading XLIFF files."""
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_1_2_SAMPLE)
+        
+        result = read_xliff_file(xliff_file)
+        assert 'files' in result
+        assert len(result['files']) == 1
+        assert 'trans-units' in result['files'][0]
+        assert len(result['files'][0]['trans-units']) == 2
+    
+    def test_read_xliff_file_without_namespace(self, xliff_dir):
+        """Test reading XLIFF files that do not declare the XLIFF namespace."""
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_1_2_SAMPLE.replace(b' xmlns="urn:oasis:names:tc:xliff:document:1.2"', b''))
+        
+        result = read_xliff_file(xliff_file)
+        assert [(u['id'], u['source'], u['target']) for u in result['files'][0]['trans-units']] == [
+            ('app.title', 'My App', 'My App'),
+            ('welcome.message', 'Welcome!', 'Welcome!'),
+        ]
+    
+    def test_read_xliff_file_from_file_object(self):
+        """Test reading XLIFF content from an in-memory binary file object."""
+        result = read_xliff_file(io.BytesIO(XLIFF_1_2_SAMPLE))
+        assert [u['id'] for u in result['files'][0]['trans-units']] == ['app.title', 'welcome.message']
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
-        
-        try:
-            result = read_xliff_file(temp_file)
-            assert 'files' in result
-            assert len(result['files']) == 1
-            assert 'trans-units' in result['files'][0]
-            assert len(result['files'][0]['trans-units']) == 2
-        finally:
-            os.unlink(temp_file)
+        with pytest.raises(ValueError):
+            read_xliff_file(io.BytesIO(b"invalid xml content"))
     
     def test_read_xliff_file_not_found(self):
         """Test reading non-existent XLIFF file."""
         with pytest.raises(FileNotFoundError):
             read_xliff_file("nonexistent.xlf")
     
-    def test_read_xliff_file_invalid_xml(self):
+    def test_read_xliff_file_invalid_xml(self, xliff_dir):
         """Test reading invalid XML XLIFF file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False) as f:
-            f.write("invalid xml content")
-            temp_file = f.name
-        
-        try:
-            with pytest.raises(ValueError):
-                read_xliff_file(temp_file)
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(b"invalid xml content")
+        
+        with pytest.raises(ValueError):
+            read_xliff_file(xliff_file)
     
-    def test_write_xliff_file(self):
+    def test_write_xliff_file(self, xliff_dir):
         """Test writing XLIFF files."""
         xliff_content = {
             'files': [{
@@ -81,17 +283,50 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "en")
-            
-            # Read it back to verify
-            result = read_xliff_file(temp_file)
-            assert 'files' in result
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        written = write_xliff_file(xliff_file, xliff_content, "en", "en")
+        
+        # The returned document is what was written to disk
+        assert xliff_file.read_bytes() == written
+        assert not list(xliff_dir.glob('*.tmp'))
+        
+        # A new file gets the usual permissions, not the temporary file's
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert stat.S_IMODE(os.stat(xliff_file).st_mode) == 0o666 & ~umask
+        
+        # Read it back to verify
+        result = read_xliff_file(xliff_file)
+        assert 'files' in result
+    
+    def test_write_xliff_file_through_symlink(self, xliff_dir):
+        """Test that writing through a symlink updates the linked file and keeps its mode."""
+        real_file = xliff_dir / 'linked_real.xlf'
+        real_file.write_bytes(b'')
+        os.chmod(real_file, 0o640)
+        link_file = xliff_dir / 'linked.xlf'
+        os.symlink(real_file, link_file)
+        xliff_content = {'app.title': 'My App'}
+        
+        written = write_xliff_file(link_file, xliff_content, "en", "de")
+        
+        assert os.path.islink(link_file)
+        assert real_file.read_bytes() == written
+        assert stat.S_IMODE(os.stat(real_file).st_mode) == 0o640
+        assert not list(xliff_dir.glob('*.tmp'))
+    
+    def test_write_xliff_file_removes_temp_file_on_failure(self, xliff_dir):
+        """Test that a failed replace leaves the existing file and no temporary file behind."""
+        xliff_file = xliff_dir / 'failed.xlf'
+        xliff_file.write_bytes(XLIFF_1_2_SAMPLE)
+        
+        with patch('algebras.utils.xliff_handler.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_xliff_file(xliff_file, {'app.title': 'My App'}, "en", "de")
+        
+        assert xliff_file.read_bytes() == XLIFF_1_2_SAMPLE
+        assert not list(xliff_dir.glob('*.tmp'))
     
     def test_extract_translatable_strings(self):
         """Test extracting translatable strings from XLIFF content."""
@@ -134,32 +369,28 @@ class TestXLIFFHandler:
         assert result['files'][0]['target-language'] == 'en'
         assert len(result['files'][0]['trans-units']) == 2
     
-    def test_is_valid_xliff_file(self):
+    def test_is_valid_xliff_file(self, xliff_dir):
         """Test XLIFF file validation."""
         # Valid XLIFF file
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
-  <file original="messages" source-language="en" target-language="en" datatype="plaintext">
-    <body>
-      <trans-unit id="app.title">
-        <source>My App</source>
-        <target>My App</target>
-      </trans-unit>
-    </body>
-  </file>
-</xliff>'''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_1_2_SAMPLE)
         
-        try:
-            assert is_valid_xliff_file(temp_file) is True
-        finally:
-            os.unlink(temp_file)
+        assert is_valid_xliff_file(xliff_file) is True
         
         # Invalid file
         assert is_valid_xliff_file("nonexistent.xlf") is False
+        
+        # Well-formed XML that is not XLIFF
+        xliff_file.write_bytes(b'<?xml version="1.0" encoding="UTF-8"?>\n<resources><string name="a">A</string></resources>')
+        assert is_valid_xliff_file(xliff_file) is False
+        
+        # Malformed XML
+        xliff_file.write_bytes(b"invalid xml content")
+        assert is_valid_xliff_file(xliff_file) is False
+        
+        # Truncated XLIFF document
+        xliff_file.write_bytes(XLIFF_1_2_SAMPLE.split(b'</source>')[0] + b'</sourc')
+        assert is_valid_xliff_file(xliff_file) is False
     
     def test_get_xliff_language_code_from_filename(self):
         """Test extracting language code from XLIFF filename."""
@@ -168,67 +399,30 @@ class TestXLIFFHandler:
         assert get_xliff_language_code("messages.en_US.xlf") == "en_US"
         assert get_xliff_language_code("messages.xlf") is None
     
-    def test_get_xliff_language_code_from_content(self):
+    def test_get_xliff_language_code_from_content(self, xliff_dir):
         """Test extracting language code from XLIFF content."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
-  <file original="messages" source-language="en" target-language="de" datatype="plaintext">
-    <body>
-      <trans-unit id="app.title">
-        <source>My App</source>
-        <target>Meine App</target>
-      </trans-unit>
-    </body>
-  </file>
-</xliff>'''
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_1_2_DE_SAMPLE)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
-        
-        try:
-            result = get_xliff_language_code(temp_file)
-            assert result == "de"
-        finally:
-            os.unlink(temp_file)
+        result = get_xliff_language_code(xliff_file)
+        assert result == "de"
 
-    def test_read_xliff_file_2_0(self):
+    def test_read_xliff_file_2_0(self, xliff_dir):
         """Test reading XLIFF 2.0 files."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en-US">
-  <file id="ngi18n" original="ng.template">
-    <unit id="6439365426343089851">
-      <segment>
-        <source>General</source>
-      </segment>
-    </unit>
-    <unit id="6812930637022637485">
-      <segment>
-        <source>Display</source>
-        <target>Affichage</target>
-      </segment>
-    </unit>
-  </file>
-</xliff>'''
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_2_0_SAMPLE)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
-        
-        try:
-            result = read_xliff_file(temp_file)
-            assert 'files' in result
-            assert result['version'] == '2.0'
-            assert len(result['files']) == 1
-            assert 'trans-units' in result['files'][0]
-            assert len(result['files'][0]['trans-units']) == 2
-            assert result['files'][0]['trans-units'][0]['id'] == '6439365426343089851'
-            assert result['files'][0]['trans-units'][0]['source'] == 'General'
-            assert result['files'][0]['trans-units'][1]['id'] == '6812930637022637485'
-            assert result['files'][0]['trans-units'][1]['source'] == 'Display'
-            assert result['files'][0]['trans-units'][1]['target'] == 'Affichage'
-        finally:
-            os.unlink(temp_file)
+        result = read_xliff_file(xliff_file)
+        assert 'files' in result
+        assert result['version'] == '2.0'
+        assert len(result['files']) == 1
+        assert 'trans-units' in result['files'][0]
+        assert len(result['files'][0]['trans-units']) == 2
+        assert result['files'][0]['trans-units'][0]['id'] == '6439365426343089851'
+        assert result['files'][0]['trans-units'][0]['source'] == 'General'
+        assert result['files'][0]['trans-units'][1]['id'] == '6812930637022637485'
+        assert result['files'][0]['trans-units'][1]['source'] == 'Display'
+        assert result['files'][0]['trans-units'][1]['target'] == 'Affichage'
 
     def test_extract_translatable_strings_xliff_2_0(self):
         """Test extracting translatable strings from XLIFF 2.0 content."""
@@ -257,119 +451,46 @@ class TestXLIFFHandler:
         }
         assert result == expected
 
-    def test_is_valid_xliff_file_2_0(self):
+    def test_is_valid_xliff_file_2_0(self, xliff_dir):
         """Test XLIFF 2.0 file validation."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en-US">
-  <file id="ngi18n" original="ng.template">
-    <unit id="6439365426343089851">
-      <segment>
-        <source>General</source>
-      </segment>
-    </unit>
-  </file>
-</xliff>'''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_2_0_SAMPLE)
         
-        try:
-            assert is_valid_xliff_file(temp_file) is True
-        finally:
-            os.unlink(temp_file)
+        assert is_valid_xliff_file(xliff_file) is True
 
-    def test_update_xliff_targets(self):
-        """Test updating XLIFF targets while preserving source text."""
-        xliff_content = {
-            'version': '2.0',
-            'files': [{
-                'original': 'messages',
-                'source-language': 'en',
-                'target-language': 'vi',
-                'trans-units': [
-                    {
-                        'id': '1009606887419612072',
-                        'source': 'Patient management',
-                        'target': ''
-                    },
-                    {
-                        'id': '6439365426343089851',
-                        'source': 'General',
-                        'target': 'Tổng quát'
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            '1009606887419612072': 'Quản lý bệnh nhân',
-            '6439365426343089851': 'Tổng quát mới'  # Update existing translation
-        }
-        
-        result = update_xliff_targets(xliff_content, translations)
-        
-        # Verify source text is preserved
-        assert result['files'][0]['trans-units'][0]['source'] == 'Patient management'
-        assert result['files'][0]['trans-units'][1]['source'] == 'General'
-        
-        # Verify target text is updated
-        assert result['files'][0]['trans-units'][0]['target'] == 'Quản lý bệnh nhân'
-        assert result['files'][0]['trans-units'][1]['target'] == 'Tổng quát mới'
+    @pytest.mark.parametrize(
+        "xliff_content, translations, source_content, target_state, expected_units",
+        UPDATE_XLIFF_TARGETS_CASES,
+    )
+    def test_update_xliff_targets(self, xliff_content, translations, source_content,
+                                  target_state, expected_units):
+        """Test updating XLIFF targets while preserving source text, order and state."""
+        result = update_xliff_targets(
+            copy.deepcopy(xliff_content), translations, source_content, target_state
+        )
         
         # Verify structure is preserved
-        assert result['version'] == '2.0'
-        assert result['files'][0]['original'] == 'messages'
-        assert result['files'][0]['source-language'] == 'en'
-        assert result['files'][0]['target-language'] == 'vi'
+        assert result['version'] == xliff_content['version']
+        file_attrs = {k: v for k, v in result['files'][0].items() if k != 'trans-units'}
+        assert file_attrs == {k: v for k, v in xliff_content['files'][0].items() if k != 'trans-units'}
+        
+        # Verify units keep their order and source, targets are updated and state
+        # is only present where expected (existing state or new unit from source)
+        assert result['files'][0]['trans-units'] == [
+            {'id': unit_id, **fields} for unit_id, fields in expected_units.items()
+        ]
 
-    def test_update_xliff_targets_preserves_untranslated(self):
-        """Test that update_xliff_targets preserves units not in translations."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Source 1',
-                        'target': 'Target 1'
-                    },
-                    {
-                        'id': 'key2',
-                        'source': 'Source 2',
-                        'target': ''
-                    },
-                    {
-                        'id': 'key3',
-                        'source': 'Source 3',
-                        'target': 'Target 3'
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            'key2': 'New Target 2'
-        }
+    def test_update_xliff_targets_updates_in_place(self):
+        """Test that update_xliff_targets mutates and returns the given content instead of copying it."""
+        xliff_content = _xliff('1.2', [{'id': 'key1', 'source': 'Hello', 'target': ''}])
+        unit = xliff_content['files'][0]['trans-units'][0]
         
-        result = update_xliff_targets(xliff_content, translations)
+        result = update_xliff_targets(xliff_content, {'key1': 'Hola'})
         
-        # Verify all units are preserved
-        assert len(result['files'][0]['trans-units']) == 3
-        
-        # Verify key1 is unchanged
-        assert result['files'][0]['trans-units'][0]['source'] == 'Source 1'
-        assert result['files'][0]['trans-units'][0]['target'] == 'Target 1'
-        
-        # Verify key2 is updated
-        assert result['files'][0]['trans-units'][1]['source'] == 'Source 2'
-        assert result['files'][0]['trans-units'][1]['target'] == 'New Target 2'
-        
-        # Verify key3 is unchanged
-        assert result['files'][0]['trans-units'][2]['source'] == 'Source 3'
-        assert result['files'][0]['trans-units'][2]['target'] == 'Target 3'
+        assert result is xliff_content
+        assert unit['target'] == 'Hola'
 
-    def test_write_xliff_file_preserves_source_text(self):
+    def test_write_xliff_file_preserves_source_text(self, xliff_dir):
         """Test that write_xliff_file preserves source text when writing."""
         xliff_content = {
             'version': '2.0',
@@ -388,22 +509,18 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "vi")
-            
-            # Read it back and verify
-            result = read_xliff_file(temp_file)
-            assert result['version'] == '2.0'
-            assert len(result['files']) == 1
-            assert result['files'][0]['trans-units'][0]['source'] == 'Patient management'
-            assert result['files'][0]['trans-units'][0]['target'] == 'Quản lý bệnh nhân'
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        write_xliff_file(xliff_file, xliff_content, "en", "vi")
+        
+        # Read it back and verify
+        result = read_xliff_file(xliff_file)
+        assert result['version'] == '2.0'
+        assert len(result['files']) == 1
+        assert result['files'][0]['trans-units'][0]['source'] == 'Patient management'
+        assert result['files'][0]['trans-units'][0]['target'] == 'Quản lý bệnh nhân'
 
-    def test_write_xliff_file_preserves_version_2_0(self):
+    def test_write_xliff_file_preserves_version_2_0(self, xliff_dir):
         """Test that write_xliff_file preserves XLIFF 2.0 format."""
         xliff_content = {
             'version': '2.0',
@@ -422,28 +539,22 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en-US", "vi")
-            
-            # Read it back and verify it's still XLIFF 2.0
-            result = read_xliff_file(temp_file)
-            assert result['version'] == '2.0'
-            assert result['files'][0]['source-language'] == 'en-US'
-            
-            # Verify the XML structure is XLIFF 2.0 (unit with segment)
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert 'version="2.0"' in content
-                assert 'xmlns="urn:oasis:names:tc:xliff:document:2.0"' in content
-                assert '<unit id=' in content
-                assert '<segment>' in content
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        content = write_xliff_file(xliff_file, xliff_content, "en-US", "vi").decode('utf-8')
+        
+        # Read it back and verify it's still XLIFF 2.0
+        result = read_xliff_file(xliff_file)
+        assert result['version'] == '2.0'
+        assert result['files'][0]['source-language'] == 'en-US'
+        
+        # Verify the XML structure is XLIFF 2.0 (unit with segment)
+        assert 'version="2.0"' in content
+        assert 'xmlns="urn:oasis:names:tc:xliff:document:2.0"' in content
+        assert '<unit id=' in content
+        assert '<segment>' in content
 
-    def test_write_xliff_file_preserves_version_1_2(self):
+    def test_write_xliff_file_preserves_version_1_2(self, xliff_dir):
         """Test that write_xliff_file preserves XLIFF 1.2 format."""
         xliff_content = {
             'version': '1.2',
@@ -462,73 +573,19 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "fr")
-            
-            # Read it back and verify it's still XLIFF 1.2
-            result = read_xliff_file(temp_file)
-            assert result['version'] == '1.2'
-            
-            # Verify the XML structure is XLIFF 1.2 (trans-unit in body)
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert 'version="1.2"' in content
-                assert 'xmlns="urn:oasis:names:tc:xliff:document:1.2"' in content
-                assert '<body>' in content
-                assert '<trans-unit id=' in content
-        finally:
-            os.unlink(temp_file)
-
-    def test_update_xliff_targets_with_empty_target(self):
-        """Test updating XLIFF targets when original target is empty."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': ''  # Empty target
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            'key1': 'Bonjour'
-        }
-        
-        result = update_xliff_targets(xliff_content, translations)
-        
-        assert result['files'][0]['trans-units'][0]['source'] == 'Hello'
-        assert result['files'][0]['trans-units'][0]['target'] == 'Bonjour'
-
-    def test_update_xliff_targets_handles_missing_translation(self):
-        """Test that update_xliff_targets handles units without translations gracefully."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': ''
-                    }
-                ]
-            }]
-        }
+        xliff_file = xliff_dir / 'doc.xlf'
         
-        translations = {}  # No translations provided
+        content = write_xliff_file(xliff_file, xliff_content, "en", "fr").decode('utf-8')
         
-        result = update_xliff_targets(xliff_content, translations)
+        # Read it back and verify it's still XLIFF 1.2
+        result = read_xliff_file(xliff_file)
+        assert result['version'] == '1.2'
         
-        # Should keep target empty (not use source) when no translation provided
-        # This makes missing translations more visible
-        assert result['files'][0]['trans-units'][0]['source'] == 'Hello'
-        assert result['files'][0]['trans-units'][0]['target'] == ''
+        # Verify the XML structure is XLIFF 1.2 (trans-unit in body)
+        assert 'version="1.2"' in content
+        assert 'xmlns="urn:oasis:names:tc:xliff:document:1.2"' in content
+        assert '<body>' in content
+        assert '<trans-unit id=' in content
 
     def test_update_xliff_targets_adds_missing_units_from_source(self):
         """Test that update_xliff_targets adds new units from source that don't exist in target."""
@@ -590,19 +647,19 @@ class TestXLIFFHandler:
         # Verify new units from source are added
         assert len(result['files'][0]['trans-units']) == 3
         
+        units = _index_units_by_id(result['files'][0])
+        
         # Find key2
-        key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-        assert key2_unit is not None
+        key2_unit = units['key2']
         assert key2_unit['source'] == 'World'
         assert key2_unit['target'] == 'Mundo'
         
         # Find key3
-        key3_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key3'), None)
-        assert key3_unit is not None
+        key3_unit = units['key3']
         assert key3_unit['source'] == 'Test'
         assert key3_unit['target'] == 'Prueba'
 
-    def test_write_xliff_file_adds_state_attribute(self):
+    def test_write_xliff_file_adds_state_attribute(self, xliff_dir):
         """Test that write_xliff_file adds state attribute to target elements when unit has state."""
         xliff_content = {
             'version': '2.0',
@@ -621,79 +678,17 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "es", "translated")
-            
-            # Read it back and verify state attribute is present
-            # For XLIFF 2.0, state goes on segment, not target
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert 'state="needs-review-translation"' in content
-                assert '<segment state="needs-review-translation">' in content
-        finally:
-            os.unlink(temp_file)
-
-    def test_write_xliff_file_preserves_existing_state(self):
-        """Test that write_xliff_file preserves existing state from unit data."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': 'Hola',
-                        'state': 'final'  # Existing state
-                    }
-                ]
-            }]
-        }
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            # Pass different state, but unit's state should take precedence
-            write_xliff_file(temp_file, xliff_content, "en", "es", "needs-review-translation")
-            
-            # Read it back and verify the unit's state is preserved
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert 'state="final"' in content
-                assert 'state="needs-review-translation"' not in content
-        finally:
-            os.unlink(temp_file)
-
-    def test_update_xliff_targets_updates_target_without_state_for_existing_units(self):
-        """Test that update_xliff_targets updates target but does NOT set state for existing units."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': ''
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            'key1': 'Hola'
-        }
+        xliff_file = xliff_dir / 'doc.xlf'
         
-        result = update_xliff_targets(xliff_content, translations, None, "needs-review-translation")
+        content = write_xliff_file(xliff_file, xliff_content, "en", "es", "translated").decode('utf-8')
         
-        assert result['files'][0]['trans-units'][0]['target'] == 'Hola'
-        # State should NOT be set for existing units, only for new units from source
-        assert 'state' not in result['files'][0]['trans-units'][0]
+        # Verify state attribute is present
+        # For XLIFF 2.0, state goes on segment, not target
+        assert 'state="needs-review-translation"' in content
+        assert '<segment state="needs-review-translation">' in content
 
-    def test_update_xliff_targets_preserves_existing_state(self):
-        """Test that update_xliff_targets preserves existing state attributes."""
+    def test_write_xliff_file_preserves_existing_state(self, xliff_dir):
+        """Test that write_xliff_file preserves existing state from unit data."""
         xliff_content = {
             'version': '1.2',
             'files': [{
@@ -708,140 +703,24 @@ class TestXLIFFHandler:
             }]
         }
         
-        translations = {
-            'key1': 'Hola Updated'
-        }
+        xliff_file = xliff_dir / 'doc.xlf'
         
-        # Pass different state, but existing state should be preserved
-        result = update_xliff_targets(xliff_content, translations, None, "needs-review-translation")
+        # Pass different state, but unit's state should take precedence
+        content = write_xliff_file(xliff_file, xliff_content, "en", "es", "needs-review-translation").decode('utf-8')
         
-        assert result['files'][0]['trans-units'][0]['target'] == 'Hola Updated'
-        assert result['files'][0]['trans-units'][0]['state'] == 'final'  # Preserved
+        # Verify the unit's state is preserved
+        assert 'state="final"' in content
+        assert 'state="needs-review-translation"' not in content
 
-    def test_read_xliff_file_preserves_state_attribute(self):
+    def test_read_xliff_file_preserves_state_attribute(self, xliff_dir):
         """Test that read_xliff_file preserves state attribute when reading."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en-US">
-  <file id="ngi18n" original="ng.template">
-    <unit id="6439365426343089851">
-      <segment>
-        <source>General</source>
-        <target state="needs-review-translation">Général</target>
-      </segment>
-    </unit>
-  </file>
-</xliff>'''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
+        xliff_file = xliff_dir / 'doc.xlf'
+        xliff_file.write_bytes(XLIFF_2_0_WITH_STATE_SAMPLE)
         
-        try:
-            result = read_xliff_file(temp_file)
-            assert result['files'][0]['trans-units'][0]['state'] == 'needs-review-translation'
-        finally:
-            os.unlink(temp_file)
+        result = read_xliff_file(xliff_file)
+        assert result['files'][0]['trans-units'][0]['state'] == 'needs-review-translation'
 
-    def test_update_xliff_targets_sets_state_only_for_translated_keys(self):
-        """Test that update_xliff_targets sets state ONLY for keys in translations dict."""
-        xliff_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': 'Hola'  # Already translated, not in translations dict
-                    },
-                    {
-                        'id': 'key2',
-                        'source': 'World',
-                        'target': ''  # Missing translation, will be in translations dict
-                    },
-                    {
-                        'id': 'key3',
-                        'source': 'Test',
-                        'target': 'Prueba'  # Already translated, not in translations dict
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            'key2': 'Mundo'  # Only key2 is being translated
-        }
-        
-        result = update_xliff_targets(xliff_content, translations, None, "needs-review")
-        
-        # key1: not in translations, should NOT get state
-        key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
-        assert key1_unit is not None
-        assert key1_unit['target'] == 'Hola'
-        assert 'state' not in key1_unit  # Should NOT have state
-        
-        # key2: in translations, target updated but state should NOT be set for existing units
-        key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-        assert key2_unit is not None
-        assert key2_unit['target'] == 'Mundo'
-        assert 'state' not in key2_unit  # State should NOT be set for existing units
-        
-        # key3: not in translations, should NOT get state
-        key3_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key3'), None)
-        assert key3_unit is not None
-        assert key3_unit['target'] == 'Prueba'
-        assert 'state' not in key3_unit  # Should NOT have state
-
-    def test_update_xliff_targets_sets_state_for_new_units_from_source(self):
-        """Test that update_xliff_targets sets state for new units added from source."""
-        target_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': 'Hola'
-                    }
-                ]
-            }]
-        }
-        
-        source_content = {
-            'version': '1.2',
-            'files': [{
-                'trans-units': [
-                    {
-                        'id': 'key1',
-                        'source': 'Hello',
-                        'target': 'Hello'
-                    },
-                    {
-                        'id': 'key2',
-                        'source': 'World',
-                        'target': 'World'
-                    }
-                ]
-            }]
-        }
-        
-        translations = {
-            'key2': 'Mundo'
-        }
-        
-        result = update_xliff_targets(target_content, translations, source_content, "needs-review")
-        
-        # key1: existing unit, not in translations, should NOT get state
-        key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
-        assert key1_unit is not None
-        assert 'state' not in key1_unit
-        
-        # key2: new unit from source, in translations, should get state
-        key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-        assert key2_unit is not None
-        assert key2_unit['target'] == 'Mundo'
-        assert key2_unit['state'] == 'needs-review'
-
-    def test_write_xliff_file_only_writes_state_when_unit_has_state(self):
+    def test_write_xliff_file_only_writes_state_when_unit_has_state(self, xliff_dir):
         """Test that write_xliff_file only writes state attribute when unit explicitly has it."""
         xliff_content = {
             'version': '1.2',
@@ -862,31 +741,23 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            # Pass target_state, but it should only be used if unit has state
-            write_xliff_file(temp_file, xliff_content, "en", "es", "translated")
-            
-            # Read it back and verify
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # key1 should have state
-                assert 'id="key1"' in content
-                assert 'state="needs-review"' in content
-                # key2 should NOT have state
-                assert 'id="key2"' in content
-                # Verify key2's target doesn't have state attribute
-                import re
-                key2_target_match = re.search(r'id="key2"[^>]*>.*?<target([^>]*)>Mundo</target>', content, re.DOTALL)
-                if key2_target_match:
-                    target_attrs = key2_target_match.group(1)
-                    assert 'state=' not in target_attrs
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        # Pass target_state, but it should only be used if unit has state
+        content = write_xliff_file(xliff_file, xliff_content, "en", "es", "translated").decode('utf-8')
+        
+        targets = {
+            unit.get('id'): unit.find(f'{{{XLIFF_1_2_NS}}}target')
+            for unit in ET.fromstring(content).iter(f'{{{XLIFF_1_2_NS}}}trans-unit')
+        }
+        assert list(targets) == ['key1', 'key2']
+        # key1 should have state
+        assert targets['key1'].get('state') == 'needs-review'
+        # key2's target should NOT have a state attribute
+        assert targets['key2'].text == 'Mundo'
+        assert targets['key2'].get('state') is None
 
-    def test_write_xliff_file_preserves_existing_state_values(self):
+    def test_write_xliff_file_preserves_existing_state_values(self, xliff_dir):
         """Test that write_xliff_file preserves existing state values, doesn't overwrite with target_state param."""
         xliff_content = {
             'version': '2.0',
@@ -908,22 +779,19 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            # Pass different target_state, but unit's state should be preserved
-            write_xliff_file(temp_file, xliff_content, "en", "es", "translated")
-            
-            # Read it back and verify states are preserved
-            result = read_xliff_file(temp_file)
-            key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
-            key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-            
-            assert key1_unit['state'] == 'final'
-            assert key2_unit['state'] == 'needs-review'
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        # Pass different target_state, but unit's state should be preserved
+        write_xliff_file(xliff_file, xliff_content, "en", "es", "translated")
+        
+        # Read it back and verify states are preserved
+        result = read_xliff_file(xliff_file)
+        units = _index_units_by_id(result['files'][0])
+        key1_unit = units['key1']
+        key2_unit = units['key2']
+        
+        assert key1_unit['state'] == 'final'
+        assert key2_unit['state'] == 'needs-review'
 
     def test_update_xliff_targets_does_not_set_state_for_units_not_in_translations(self):
         """Test that update_xliff_targets does NOT set state for units not in translations dict."""
@@ -952,52 +820,29 @@ class TestXLIFFHandler:
         result = update_xliff_targets(xliff_content, translations, None, "needs-review")
         
         # key1: in translations, target updated but state should NOT be set for existing units
-        key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units = _index_units_by_id(result['files'][0])
+        key1_unit = units['key1']
         assert key1_unit['target'] == 'Hola Updated'
         assert 'state' not in key1_unit  # State should NOT be set for existing units
         
         # key2: NOT in translations, should NOT get state
-        key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
+        key2_unit = units['key2']
         assert key2_unit['target'] == 'Mundo'
         assert 'state' not in key2_unit  # Should NOT have state
 
     def test_read_xliff_file_preserves_units_without_state(self):
         """Test that read_xliff_file correctly handles units without state attribute."""
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
-  <file source-language="en" target-language="es">
-    <body>
-      <trans-unit id="key1">
-        <source>Hello</source>
-        <target>Hola</target>
-      </trans-unit>
-      <trans-unit id="key2">
-        <source>World</source>
-        <target state="needs-review">Mundo</target>
-      </trans-unit>
-    </body>
-  </file>
-</xliff>'''
+        result = read_xliff_file(io.BytesIO(XLIFF_1_2_PARTIAL_STATE_SAMPLE))
+        assert len(result['files'][0]['trans-units']) == 2
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False, encoding='utf-8') as f:
-            f.write(xliff_content)
-            temp_file = f.name
-        
-        try:
-            result = read_xliff_file(temp_file)
-            assert len(result['files'][0]['trans-units']) == 2
-            
-            key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
-            assert key1_unit is not None
-            assert 'state' not in key1_unit  # Should NOT have state key
-            
-            key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-            assert key2_unit is not None
-            assert key2_unit['state'] == 'needs-review'  # Should have state
-        finally:
-            os.unlink(temp_file)
+        units = _index_units_by_id(result['files'][0])
+        key1_unit = units['key1']
+        assert 'state' not in key1_unit  # Should NOT have state key
+        
+        key2_unit = units['key2']
+        assert key2_unit['state'] == 'needs-review'  # Should have state
 
-    def test_write_xliff_file_roundtrip_preserves_state_selectively(self):
+    def test_write_xliff_file_roundtrip_preserves_state_selectively(self, xliff_dir):
         """Test that write/read roundtrip preserves state only for units that had it."""
         xliff_content = {
             'version': '1.2',
@@ -1019,19 +864,16 @@ class TestXLIFFHandler:
             }]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "es", "translated")
-            
-            # Read it back
-            result = read_xliff_file(temp_file)
-            
-            key1_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key1'), None)
-            key2_unit = next((u for u in result['files'][0]['trans-units'] if u['id'] == 'key2'), None)
-            
-            assert key1_unit['state'] == 'needs-review'
-            assert 'state' not in key2_unit
-        finally:
-            os.unlink(temp_file)
+        xliff_file = xliff_dir / 'doc.xlf'
+        
+        write_xliff_file(xliff_file, xliff_content, "en", "es", "translated")
+        
+        # Read it back
+        result = read_xliff_file(xliff_file)
+        
+        units = _index_units_by_id(result['files'][0])
+        key1_unit = units['key1']
+        key2_unit = units['key2']
+        
+        assert key1_unit['state'] == 'needs-review'
+        assert 'state' not in key2_unit
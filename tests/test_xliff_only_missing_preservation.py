@@ -11,7 +11,8 @@ import os
 import tempfile
 import pytest
 from algebras.utils.xliff_handler import (
-    read_xliff_file, write_xliff_file, update_xliff_targets, extract_translatable_strings
+    read_xliff_file, write_xliff_file, update_xliff_targets, extract_translatable_strings,
+    _index_units_by_id
 )
 
 
@@ -64,16 +65,17 @@ class TestXLIFFOnlyMissingPreservation:
         # Verify existing translations are preserved
         assert len(updated['files'][0]['trans-units']) == 3
         
-        key1_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units = _index_units_by_id(updated['files'][0])
+        key1_unit = units.get('key1')
         assert key1_unit is not None
         assert key1_unit['target'] == 'Bonjour'  # Preserved
         
-        key2_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key2'), None)
+        key2_unit = units.get('key2')
         assert key2_unit is not None
         assert key2_unit['target'] == 'Monde'  # Preserved
         
         # Verify missing key was added
-        key3_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key3'), None)
+        key3_unit = units.get('key3')
         assert key3_unit is not None
         assert key3_unit['target'] == 'Teste'  # Newly translated
     
@@ -118,7 +120,8 @@ class TestXLIFFOnlyMissingPreservation:
         updated_run1 = update_xliff_targets(target_content, translations_run1, source_content)
         
         # Verify existing translations preserved
-        key1_unit = next((u for u in updated_run1['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units_run1 = _index_units_by_id(updated_run1['files'][0])
+        key1_unit = units_run1.get('key1')
         assert key1_unit['target'] == 'Bonjour'
         
         # Second run: simulate running again with same missing keys (should be empty now)
@@ -127,10 +130,11 @@ class TestXLIFFOnlyMissingPreservation:
         updated_run2 = update_xliff_targets(updated_run1, translations_run2, source_content)
         
         # Verify existing translations still preserved
-        key1_unit_run2 = next((u for u in updated_run2['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units_run2 = _index_units_by_id(updated_run2['files'][0])
+        key1_unit_run2 = units_run2.get('key1')
         assert key1_unit_run2['target'] == 'Bonjour'  # Still preserved
         
-        key2_unit_run2 = next((u for u in updated_run2['files'][0]['trans-units'] if u['id'] == 'key2'), None)
+        key2_unit_run2 = units_run2.get('key2')
         assert key2_unit_run2['target'] == 'Monde'  # Still preserved
     
     def test_only_missing_keys_are_translated(self):
@@ -177,11 +181,12 @@ class TestXLIFFOnlyMissingPreservation:
         updated = update_xliff_targets(target_content, translations, source_content, only_missing=True)
         
         # Verify key1 was NOT overwritten
-        key1_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units = _index_units_by_id(updated['files'][0])
+        key1_unit = units.get('key1')
         assert key1_unit['target'] == 'Bonjour'  # Original preserved, not 'Salut'
         
         # Verify key2 was added
-        key2_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key2'), None)
+        key2_unit = units.get('key2')
         assert key2_unit is not None
         assert key2_unit['target'] == 'Monde'
     
@@ -223,10 +228,11 @@ class TestXLIFFOnlyMissingPreservation:
         updated = update_xliff_targets(target_content, translations, source_content)
         
         # Verify key1 target is preserved
-        key1_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key1'), None)
+        units = _index_units_by_id(updated['files'][0])
+        key1_unit = units.get('key1')
         assert key1_unit['target'] == 'Bonjour'  # Preserved, not replaced
         
         # Verify key2 was added
-        key2_unit = next((u for u in updated['files'][0]['trans-units'] if u['id'] == 'key2'), None)
+        key2_unit = units.get('key2')
         assert key2_unit['target'] == 'Monde'
 
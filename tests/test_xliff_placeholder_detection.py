@@ -69,6 +69,23 @@ class TestXLIFFPlaceholderDetection:
         # Should detect mrk tag
         assert any('mrk' in str(p) or 'm1' in str(p) for p in placeholders)
     
+    def test_extract_unclosed_and_nested_tags(self):
+        """
+        Test how extract_xliff_placeholders handles unclosed and nested tags.
+        
+        Behavior: A paired tag ends at its first closing tag, a self-closing tag
+        stands on its own, and an opening tag without a closing tag is skipped.
+        """
+        text = '<pc id="1">a <PC>b</pc> c</pc> <ph id="2"/> <mrk>open <ph id="3"/>'
+        
+        assert extract_xliff_placeholders(text) == [
+            '<pc id="1">a <PC>b</pc>',
+            '<ph id="2"/>',
+            '<ph id="3"/>',
+        ]
+        # Many unclosed tags must not make the scan quadratic
+        assert extract_xliff_placeholders('<ph>x' * 20000) == []
+    
     def test_check_xliff_placeholders_missing_placeholder(self):
         """
         Test that check_xliff_placeholders reports missing placeholders as errors.
@@ -119,6 +136,16 @@ class TestXLIFFPlaceholderDetection:
         errors = [i for i in issues if i.severity == 'error']
         assert len(errors) == 0
     
+    def test_check_xliff_placeholders_without_tags(self):
+        """
+        Test that check_xliff_placeholders reports nothing for plain text.
+        
+        Behavior: Strings without any tags, including an empty source, have no
+        XLIFF placeholders to compare.
+        """
+        assert check_xliff_placeholders('Hello %name!', 'Bonjour %name !', key="test.key") == []
+        assert check_xliff_placeholders('', 'Bonjour', key="test.key") == []
+    
     def test_check_xliff_placeholders_multiple_placeholders(self):
         """
         Test that check_xliff_placeholders handles multiple placeholders correctly.
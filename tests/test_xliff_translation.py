@@ -2,18 +2,37 @@
 Integration tests for XLIFF translation
 """
 
-import os
-import tempfile
+import io
 import pytest
 from algebras.utils.xliff_handler import read_xliff_file, write_xliff_file, extract_translatable_strings
 
+XLIFF_SAMPLE = '''<?xml version="1.0" encoding="UTF-8" ?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+  <file original="messages" source-language="en" target-language="en" datatype="plaintext">
+    <body>
+      <trans-unit id="app.title">
+        <source>My App</source>
+        <target>My App</target>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>'''
+
+
+@pytest.fixture(scope="session")
+def xliff_sample_path(tmp_path_factory):
+    """Sample XLIFF file written once per session; tests must not modify it."""
+    path = tmp_path_factory.mktemp('xliff_sample') / 'messages.xlf'
+    path.write_text(XLIFF_SAMPLE, encoding='utf-8')
+    return path
+
 
 class TestXLIFFTranslation:
     """Integration tests for XLIFF translation."""
     
     def test_translate_xliff_file(self):
         """Test end-to-end XLIFF file translation."""
-        # Create a temporary XLIFF file
+        # Sample XLIFF document
         xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
 <xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
   <file original="messages" source-language="en" target-language="en" datatype="plaintext">
@@ -34,68 +53,41 @@ class TestXLIFFTranslation:
   </file>
 </xliff>'''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False) as f:
-            f.write(xliff_content)
-            temp_file = f.name
+        # Test that the document can be read
+        content = read_xliff_file(io.BytesIO(xliff_content.encode('utf-8')))
+        assert 'files' in content
+        assert len(content['files']) == 1
+        assert 'trans-units' in content['files'][0]
+        assert len(content['files'][0]['trans-units']) == 3
+        
+        # Test that translatable strings can be extracted
+        translatable = extract_translatable_strings(content)
+        expected = {
+            "app.title": "My Angular App",
+            "welcome.message": "Welcome to our amazing Angular application!",
+            "login.button": "Log In"
+        }
+        assert translatable == expected
+        
+        # Test that XLIFF content can be created from translations
+        from algebras.utils.xliff_handler import create_xliff_from_translations
+        new_translations = {
+            "app.title": "Meine Angular App",
+            "welcome.message": "Willkommen zu unserer erstaunlichen Angular-Anwendung!",
+            "login.button": "Anmelden"
+        }
         
-        try:
-            # Test that the file can be read
-            content = read_xliff_file(temp_file)
-            assert 'files' in content
-            assert len(content['files']) == 1
-            assert 'trans-units' in content['files'][0]
-            assert len(content['files'][0]['trans-units']) == 3
-            
-            # Test that translatable strings can be extracted
-            translatable = extract_translatable_strings(content)
-            expected = {
-                "app.title": "My Angular App",
-                "welcome.message": "Welcome to our amazing Angular application!",
-                "login.button": "Log In"
-            }
-            assert translatable == expected
-            
-            # Test that XLIFF content can be created from translations
-            from algebras.utils.xliff_handler import create_xliff_from_translations
-            new_translations = {
-                "app.title": "Meine Angular App",
-                "welcome.message": "Willkommen zu unserer erstaunlichen Angular-Anwendung!",
-                "login.button": "Anmelden"
-            }
-            
-            new_xliff = create_xliff_from_translations(new_translations, "en", "de")
-            assert 'files' in new_xliff
-            assert new_xliff['files'][0]['target-language'] == 'de'
-            
-        finally:
-            os.unlink(temp_file)
+        new_xliff = create_xliff_from_translations(new_translations, "en", "de")
+        assert 'files' in new_xliff
+        assert new_xliff['files'][0]['target-language'] == 'de'
     
-    def test_xliff_file_validation(self):
+    def test_xliff_file_validation(self, xliff_sample_path):
         """Test XLIFF file validation."""
         from algebras.utils.xliff_handler import is_valid_xliff_file, get_xliff_language_code
         
         # Valid XLIFF file
-        xliff_content = '''<?xml version="1.0" encoding="UTF-8" ?>
-<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
-  <file original="messages" source-language="en" target-language="en" datatype="plaintext">
-    <body>
-      <trans-unit id="app.title">
-        <source>My App</source>
-        <target>My App</target>
-      </trans-unit>
-    </body>
-  </file>
-</xliff>'''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xlf', delete=False) as f:
-            f.write(xliff_content)
-            temp_file = f.name
-        
-        try:
-            assert is_valid_xliff_file(temp_file) is True
-            assert get_xliff_language_code(temp_file) == "en"
-        finally:
-            os.unlink(temp_file)
+        assert is_valid_xliff_file(xliff_sample_path) is True
+        assert get_xliff_language_code(xliff_sample_path) == "en"
         
         # Invalid file
         assert is_valid_xliff_file("nonexistent.xlf") is False
@@ -119,17 +111,13 @@ class TestXLIFFTranslation:
         }
         
         # Test writing and reading back
-        with tempfile.NamedTemporaryFile(suffix='.xlf', delete=False) as f:
-            temp_file = f.name
+        buf = io.BytesIO()
+        write_xliff_file(buf, xliff_content, "en", "en")
+        buf.seek(0)
+        result = read_xliff_file(buf)
         
-        try:
-            write_xliff_file(temp_file, xliff_content, "en", "en")
-            result = read_xliff_file(temp_file)
-            
-            assert 'files' in result
-            assert len(result['files']) == 1
-            assert result['files'][0]['original'] == 'messages'
-            assert result['files'][0]['source-language'] == 'en'
-            assert result['files'][0]['target-language'] == 'en'
-        finally:
-            os.unlink(temp_file)
+        assert 'files' in result
+        assert len(result['files']) == 1
+        assert result['files'][0]['original'] == 'messages'
+        assert result['files'][0]['source-language'] == 'en'
+        assert result['files'][0]['target-language'] == 'en'
@@ -2,59 +2,58 @@
 Tests for XLSX handler
 """
 
-import os
-import tempfile
+import io
 import pytest
+from unittest.mock import Mock
+from algebras.services.strategies.xlsx_strategy import XlsxTranslationStrategy
 from algebras.utils.xlsx_handler import (
     read_xlsx_file, write_xlsx_file, extract_translatable_strings,
     create_xlsx_from_translations, add_language_to_xlsx, get_xlsx_language_codes,
     is_valid_xlsx_file, get_xlsx_language_code, is_glossary_xlsx
 )
 
+XLSX_CONTENT = {
+    'key_column': 'key',
+    'languages': ['en', 'de', 'fr'],
+    'translations': {
+        'app.title': {
+            'en': 'My Application',
+            'de': 'Meine Anwendung',
+            'fr': 'Mon Application'
+        },
+        'welcome.message': {
+            'en': 'Welcome!',
+            'de': 'Willkommen!',
+            'fr': 'Bienvenue!'
+        }
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def sample_xlsx():
+    """Workbook bytes for XLSX_CONTENT, written once per module."""
+    buffer = io.BytesIO()
+    write_xlsx_file(buffer, XLSX_CONTENT)
+    return buffer.getvalue()
+
 
 class TestXLSXHandler:
     """Test cases for XLSX handler functions."""
     
-    def test_read_xlsx_file(self):
+    def test_read_xlsx_file(self, sample_xlsx):
         """Test reading XLSX files."""
-        xlsx_content = {
-            'key_column': 'key',
-            'languages': ['en', 'de', 'fr'],
-            'translations': {
-                'app.title': {
-                    'en': 'My Application',
-                    'de': 'Meine Anwendung',
-                    'fr': 'Mon Application'
-                },
-                'welcome.message': {
-                    'en': 'Welcome!',
-                    'de': 'Willkommen!',
-                    'fr': 'Bienvenue!'
-                }
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            # Write the file first
-            write_xlsx_file(temp_file, xlsx_content)
-            
-            # Read it back
-            result = read_xlsx_file(temp_file)
-            assert result['key_column'] == 'key'
-            assert result['languages'] == ['en', 'de', 'fr']
-            assert 'translations' in result
-        finally:
-            os.unlink(temp_file)
+        result = read_xlsx_file(io.BytesIO(sample_xlsx))
+        assert result['key_column'] == 'key'
+        assert result['languages'] == ['en', 'de', 'fr']
+        assert result['translations'] == XLSX_CONTENT['translations']
     
     def test_read_xlsx_file_not_found(self):
         """Test reading non-existent XLSX file."""
         with pytest.raises(FileNotFoundError):
             read_xlsx_file("nonexistent.xlsx")
     
-    def test_write_xlsx_file(self):
+    def test_write_xlsx_file(self, tmp_path):
         """Test writing XLSX files."""
         xlsx_content = {
             'key_column': 'key',
@@ -67,18 +66,14 @@ class TestXLSXHandler:
             }
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            temp_file = f.name
+        # Missing parent directories are created
+        xlsx_file = tmp_path / 'locales' / 'strings.xlsx'
+        write_xlsx_file(str(xlsx_file), xlsx_content)
         
-        try:
-            write_xlsx_file(temp_file, xlsx_content)
-            
-            # Read it back to verify
-            result = read_xlsx_file(temp_file)
-            assert result['key_column'] == 'key'
-            assert result['languages'] == ['en', 'de']
-        finally:
-            os.unlink(temp_file)
+        # Read it back to verify
+        result = read_xlsx_file(str(xlsx_file))
+        assert result['key_column'] == 'key'
+        assert result['languages'] == ['en', 'de']
     
     def test_extract_translatable_strings(self):
         """Test extracting translatable strings for a specific language."""
@@ -143,28 +138,10 @@ class TestXLSXHandler:
         result = get_xlsx_language_codes(xlsx_content)
         assert result == ['en', 'de', 'fr']
     
-    def test_is_valid_xlsx_file(self):
+    def test_is_valid_xlsx_file(self, sample_xlsx):
         """Test XLSX file validation."""
         # Valid XLSX file
-        xlsx_content = {
-            'key_column': 'key',
-            'languages': ['en', 'de'],
-            'translations': {
-                'app.title': {
-                    'en': 'My Application',
-                    'de': 'Meine Anwendung'
-                }
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xlsx_file(temp_file, xlsx_content)
-            assert is_valid_xlsx_file(temp_file) is True
-        finally:
-            os.unlink(temp_file)
+        assert is_valid_xlsx_file(io.BytesIO(sample_xlsx)) is True
         
         # Invalid file
         assert is_valid_xlsx_file("nonexistent.xlsx") is False
@@ -173,30 +150,34 @@ class TestXLSXHandler:
         """Test getting language code from XLSX file (should return None for multi-language files)."""
         assert get_xlsx_language_code("strings.xlsx") is None
     
-    def test_is_glossary_xlsx(self):
+    def test_is_glossary_xlsx(self, sample_xlsx):
         """Test detecting glossary XLSX files."""
         # Translation XLSX
+        assert is_glossary_xlsx(io.BytesIO(sample_xlsx)) is False
+        
+        # Glossary XLSX (would need to be created with Record ID column)
+        # This test would require creating a proper glossary XLSX file
+        # For now, we'll just test the function exists
+        assert callable(is_glossary_xlsx)
+    
+    def test_xlsx_strategy_translates_repeated_strings_once(self):
+        """Test that rows sharing a source string are translated once."""
+        strategy = XlsxTranslationStrategy(Mock(), Mock(), Mock(), 10, {})
+        strategy._flat_strategy = Mock()
+        strategy._flat_strategy.translate.return_value = {'ok.button': 'Fertig', 'cancel.button': 'Abbrechen'}
         xlsx_content = {
-            'key_column': 'key',
-            'languages': ['en', 'de'],
             'translations': {
-                'app.title': {
-                    'en': 'My Application',
-                    'de': 'Meine Anwendung'
-                }
+                'ok.button': {'en': 'OK'},
+                'cancel.button': {'en': 'Cancel'},
+                'dialog.ok': {'en': 'OK'},
             }
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            write_xlsx_file(temp_file, xlsx_content)
-            assert is_glossary_xlsx(temp_file) is False
-        finally:
-            os.unlink(temp_file)
+        result = strategy.translate(xlsx_content, 'en', 'de')
         
-        # Glossary XLSX (would need to be created with Record ID column)
-        # This test would require creating a proper glossary XLSX file
-        # For now, we'll just test the function exists
-        assert callable(is_glossary_xlsx)
+        assert strategy._flat_strategy.translate.call_args[0][0] == {'ok.button': 'OK', 'cancel.button': 'Cancel'}
+        assert result['translations']['ok.button']['de'] == 'Fertig'
+        assert result['translations']['dialog.ok']['de'] == 'Fertig'
+        assert result['translations']['cancel.button']['de'] == 'Abbrechen'
+        # The input content is left untouched
+        assert xlsx_content['translations']['ok.button'] == {'en': 'OK'}
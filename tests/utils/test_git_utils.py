@@ -10,7 +10,10 @@ from algebras.utils.git_utils import (
     get_last_modified_date,
     read_file_content,
     get_key_last_modification,
-    compare_key_modifications
+    compare_key_modifications,
+    get_blame_info_batch,
+    get_keys_last_modifications_batch,
+    ensure_commit_graph
 )
 
 
@@ -28,8 +31,16 @@ class TestGitUtils(unittest.TestCase):
         self.older_date = "2023-01-01T12:00:00"
         self.newer_date = "2023-02-01T12:00:00"
         
+        # No test may run real git commands; each one configures this mock
+        subprocess_patcher = patch('subprocess.run')
+        self.mock_run = subprocess_patcher.start()
+        self.addCleanup(subprocess_patcher.stop)
+        
         # Clear LRU caches to ensure clean state between tests
-        from algebras.utils.git_utils import compare_key_modifications, get_key_last_modification, get_key_line_number
+        from algebras.utils.git_utils import compare_key_modifications, get_key_last_modification, get_key_line_number, _is_git_directory, _read_file_lines
+        _read_file_lines.cache_clear()
+        is_git_available.cache_clear()
+        _is_git_directory.cache_clear()
         compare_key_modifications.cache_clear()
         get_key_last_modification.cache_clear()
         get_key_line_number.cache_clear()
@@ -45,49 +56,93 @@ class TestGitUtils(unittest.TestCase):
         if os.path.exists(self.test_dir):
             os.rmdir(self.test_dir)
 
-    @patch('subprocess.run')
-    def test_is_git_available_success(self, mock_run):
+    def test_is_git_available_success(self):
         # Mock successful execution of git --version
         mock_process = Mock()
         mock_process.returncode = 0
-        mock_run.return_value = mock_process
+        self.mock_run.return_value = mock_process
         
         self.assertTrue(is_git_available())
-        mock_run.assert_called_once_with(['git', '--version'], capture_output=True, check=True)
+        self.mock_run.assert_called_once_with(['git', '--version'], capture_output=True, check=True)
 
-    @patch('subprocess.run')
-    def test_is_git_available_failure(self, mock_run):
+    def test_is_git_available_failure(self):
         # Mock failed execution of git --version
-        mock_run.side_effect = FileNotFoundError()
+        self.mock_run.side_effect = FileNotFoundError()
         
         self.assertFalse(is_git_available())
-        mock_run.assert_called_once_with(['git', '--version'], capture_output=True, check=True)
+        self.mock_run.assert_called_once_with(['git', '--version'], capture_output=True, check=True)
 
-    @patch('subprocess.run')
-    def test_is_git_repository_success(self, mock_run):
+    def test_is_git_repository_success(self):
         # Mock successful check for git repository
         mock_process = Mock()
         mock_process.returncode = 0
         mock_process.stdout = "true"
-        mock_run.return_value = mock_process
+        self.mock_run.return_value = mock_process
+        
+        self.assertTrue(is_git_repository(self.source_file))
+        self.mock_run.assert_called_once()
         
+        # Repeated checks for the same path reuse the cached result
         self.assertTrue(is_git_repository(self.source_file))
-        mock_run.assert_called_once()
+        self.mock_run.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_is_git_repository_failure(self, mock_run):
+    def test_is_git_repository_failure(self):
         # Mock failed check for git repository
         mock_process = Mock()
         mock_process.returncode = 128
         mock_process.stdout = "fatal: not a git repository"
-        mock_run.return_value = mock_process
+        self.mock_run.return_value = mock_process
         
         self.assertFalse(is_git_repository(self.source_file))
-        mock_run.assert_called_once()
+        self.mock_run.assert_called_once()
+
+    @patch.dict(os.environ, {"ALGEBRAS_SKIP_COMMIT_GRAPH": "1"})
+    @patch('algebras.utils.git_utils.subprocess.Popen')
+    def test_ensure_commit_graph_skip_switch(self, mock_popen):
+        ensure_commit_graph(self.test_dir)
+        
+        self.mock_run.assert_not_called()
+        mock_popen.assert_not_called()
+
+    @patch.dict(os.environ, clear=True)
+    @patch('algebras.utils.git_utils._commit_graph_processes', [])
+    @patch('algebras.utils.git_utils._commit_graph_ready', set())
+    @patch('algebras.utils.git_utils.atexit.register')
+    @patch('algebras.utils.git_utils._has_changed_paths_graph', return_value=False)
+    @patch('algebras.utils.git_utils.subprocess.Popen')
+    def test_ensure_commit_graph_once_per_repository(self, mock_popen, mock_has_graph, mock_register):
+        rev_parse = Mock(returncode=0, stdout="/repo\n.git/objects/info\n")
+        config = Mock(returncode=1, stdout="")
+        self.mock_run.side_effect = [rev_parse, config, rev_parse]
+        
+        ensure_commit_graph(self.test_dir)
+        ensure_commit_graph(self.test_dir)
+        
+        mock_popen.assert_called_once()
+        self.assertEqual(
+            mock_popen.call_args[0][0],
+            ['git', '-C', '/repo', 'commit-graph', 'write', '--reachable', '--changed-paths', '--split']
+        )
+        # The handle is kept so the write is reaped at exit
+        mock_register.assert_called_once()
+        self.assertEqual(self.mock_run.call_count, 3)
+
+    @patch.dict(os.environ, clear=True)
+    @patch('algebras.utils.git_utils._commit_graph_ready', set())
+    @patch('algebras.utils.git_utils._has_changed_paths_graph', return_value=False)
+    @patch('algebras.utils.git_utils.subprocess.Popen')
+    def test_ensure_commit_graph_disabled_by_config(self, mock_popen, mock_has_graph):
+        self.mock_run.side_effect = [
+            Mock(returncode=0, stdout="/repo\n.git/objects/info\n"),
+            Mock(returncode=0, stdout="false\n"),
+        ]
+        
+        ensure_commit_graph(self.test_dir)
+        
+        mock_popen.assert_not_called()
 
     @patch('algebras.utils.git_utils.is_git_repository')
-    @patch('subprocess.run')
-    def test_get_last_modified_date(self, mock_run, mock_is_git_repo):
+    def test_get_last_modified_date(self, mock_is_git_repo):
         # Mock git repository check
         mock_is_git_repo.return_value = True
         
@@ -95,11 +150,11 @@ class TestGitUtils(unittest.TestCase):
         mock_process = Mock()
         mock_process.returncode = 0
         mock_process.stdout = self.newer_date
-        mock_run.return_value = mock_process
+        self.mock_run.return_value = mock_process
         
         result = get_last_modified_date(self.source_file)
         self.assertEqual(result, self.newer_date)
-        mock_run.assert_called_once()
+        self.mock_run.assert_called_once()
 
     @patch('algebras.utils.git_utils.is_git_repository')
     def test_get_last_modified_date_not_git_repo(self, mock_is_git_repo):
@@ -136,8 +191,7 @@ class TestGitUtils(unittest.TestCase):
     @patch('os.path.exists', return_value=True)
     @patch('algebras.utils.git_utils.get_key_line_number', return_value=1)
     @patch('algebras.utils.git_utils.is_git_repository')
-    @patch('subprocess.run')
-    def test_get_key_last_modification(self, mock_run, mock_is_git_repo, mock_get_key_line_number, mock_exists):
+    def test_get_key_last_modification(self, mock_is_git_repo, mock_get_key_line_number, mock_exists):
         # Mock git repository check
         mock_is_git_repo.return_value = True
 
@@ -152,7 +206,7 @@ class TestGitUtils(unittest.TestCase):
         mock_git_process.stdout = f"{self.newer_date}\n"
 
         # Set side_effect for subprocess.run
-        mock_run.side_effect = [mock_git_process]
+        self.mock_run.side_effect = [mock_git_process]
 
         # Call the function we want to test
         result = get_key_last_modification(self.source_file, "key1.nested")
@@ -161,6 +215,77 @@ class TestGitUtils(unittest.TestCase):
         self.assertEqual(result, self.newer_date)
         mock_is_git_repo.assert_called_once_with(self.source_file)
 
+    @patch.dict('algebras.utils.git_utils._git_blame_cache', clear=True)
+    @patch('os.path.exists', return_value=True)
+    @patch('algebras.utils.git_utils.is_git_repository', return_value=True)
+    def test_get_blame_info_batch_single_command(self, mock_is_git_repo, mock_exists):
+        # One blame line per requested line, in line order
+        mock_blame_process = Mock()
+        mock_blame_process.returncode = 0
+        mock_blame_process.stdout = (
+            "abc12345 (Ann Lee 2023-01-01 12:00:00 +0000 2)   \"key1\": \"value1\",\n"
+            "abc12345 (Ann Lee 2023-01-01 12:00:00 +0000 3)   \"key2\": \"value2\",\n"
+            "def67890 (Bob Roe 2023-02-01 12:00:00 +0000 7)   \"key3\": \"value3\"\n"
+        )
+        self.mock_run.return_value = mock_blame_process
+
+        result = get_blame_info_batch(self.source_file, [7, 2, 3])
+
+        # All ranges are blamed with a single git command
+        self.mock_run.assert_called_once()
+        self.assertEqual(
+            self.mock_run.call_args[0][0],
+            ['git', 'blame', '-L', '2,3', '-L', '7,7', '--date=iso', '--', 'en.json']
+        )
+        self.assertEqual(result, {
+            2: ("2023-01-01T12:00:00Z", "Ann Lee"),
+            3: ("2023-01-01T12:00:00Z", "Ann Lee"),
+            7: ("2023-02-01T12:00:00Z", "Bob Roe"),
+        })
+
+    @patch.dict('algebras.utils.git_utils._git_blame_cache', clear=True)
+    @patch('os.path.exists', return_value=True)
+    @patch('algebras.utils.git_utils.is_git_repository', return_value=True)
+    def test_get_blame_info_batch_repeated_lines(self, mock_is_git_repo, mock_exists):
+        # Several keys can share a line; git prints each line only once
+        mock_blame_process = Mock()
+        mock_blame_process.returncode = 0
+        mock_blame_process.stdout = (
+            "abc12345 (Ann Lee 2020-01-01 12:00:00 +0000 3)   \"key1\": \"value1\",\n"
+            "def67890 (Bob Roe 2023-02-01 12:00:00 +0000 4)   \"key2\": \"value2\"\n"
+        )
+        self.mock_run.return_value = mock_blame_process
+
+        result = get_blame_info_batch(self.source_file, [3, 3, 4])
+
+        self.assertEqual(
+            self.mock_run.call_args[0][0],
+            ['git', 'blame', '-L', '3,4', '--date=iso', '--', 'en.json']
+        )
+        self.assertEqual(result, {
+            3: ("2020-01-01T12:00:00Z", "Ann Lee"),
+            4: ("2023-02-01T12:00:00Z", "Bob Roe"),
+        })
+
+    @patch('os.path.exists', return_value=True)
+    @patch('algebras.utils.git_utils.get_key_line_number', side_effect=[2, 3, 4])
+    @patch('algebras.utils.git_utils.is_git_repository', return_value=True)
+    def test_get_keys_last_modifications_batch_blame_failure(self, mock_is_git_repo, mock_get_key_line_number, mock_exists):
+        # Blame fails for the whole file, then the file-level log succeeds
+        mock_blame_process = Mock()
+        mock_blame_process.returncode = 128
+        mock_blame_process.stdout = ""
+        mock_log_process = Mock()
+        mock_log_process.returncode = 0
+        mock_log_process.stdout = self.newer_date + "\n"
+        self.mock_run.side_effect = [mock_blame_process, mock_log_process]
+        
+        result = get_keys_last_modifications_batch(self.source_file, ["a", "b", "c"])
+        
+        self.assertEqual(result, {"a": self.newer_date, "b": self.newer_date, "c": self.newer_date})
+        # One blame and one log, not several git calls per key
+        self.assertEqual(self.mock_run.call_count, 2)
+
     @patch('algebras.utils.git_utils.get_key_last_modification')
     def test_compare_key_modifications_source_newer(self, mock_get_key_last_mod):
         # Mock get_key_last_modification to return different dates
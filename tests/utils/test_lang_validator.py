@@ -8,6 +8,7 @@ from algebras.utils.lang_validator import (
     extract_all_keys,
     get_key_value,
     validate_language_files,
+    validate_all_targets,
     find_outdated_keys,
     map_language_code
 )
@@ -113,6 +114,16 @@ class TestLangValidator(unittest.TestCase):
         self.assertEqual(missing_keys, {"login.password"})
         self.assertEqual(mock_read_file.call_count, 2)
 
+    @patch('algebras.utils.lang_validator.read_language_file')
+    def test_validate_all_targets(self, mock_read_file):
+        # The source is read once, then each target in order
+        mock_read_file.side_effect = [self.source_data, self.target_data, self.source_data]
+        
+        results = validate_all_targets(self.source_file, ["fr.json", "de.json"])
+        
+        self.assertEqual(results, [(False, {"login.password"}), (True, set())])
+        self.assertEqual(mock_read_file.call_count, 3)
+
     @patch('algebras.utils.lang_validator.read_language_file')
     def test_validate_language_files_with_empty_values(self, mock_read_file):
         # Test data with empty string values
@@ -169,7 +180,8 @@ class TestLangValidator(unittest.TestCase):
     @patch('algebras.utils.lang_validator.is_git_repository')
     @patch('algebras.utils.lang_validator.read_language_file')
     @patch('algebras.utils.lang_validator.get_keys_last_modifications_batch')
-    def test_find_outdated_keys_with_outdated(self, mock_get_keys_batch, mock_read_file, mock_is_git_repo, mock_is_git_available):
+    @patch('algebras.utils.lang_validator.ensure_commit_graph')
+    def test_find_outdated_keys_with_outdated(self, mock_ensure_graph, mock_get_keys_batch, mock_read_file, mock_is_git_repo, mock_is_git_available):
         # Update test data to include same keys but different values
         target_data_with_diff = self.target_data.copy()
         target_data_with_diff["welcome"] = "Old welcome text"  # Different from source
@@ -200,6 +212,7 @@ class TestLangValidator(unittest.TestCase):
         mock_read_file.assert_called()
         # Verify get_keys_last_modifications_batch was called for both files
         self.assertEqual(mock_get_keys_batch.call_count, 2)
+        mock_ensure_graph.assert_called_once_with(self.source_file)
 
     @patch('algebras.utils.lang_validator.is_git_available')
     @patch('algebras.utils.lang_validator.is_git_repository')
@@ -45,9 +45,33 @@ Dima Pukhov from Algebras AI, 2025 (adapted for custom workflow).
 
 """
 
-import argparse
 import os
-from pathlib import Path
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Escape sequences understood by PO strings, in both directions
+PO_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+PO_UNESCAPES = {'\\': '\\', '"': '"', 'n': '\n', 'r': '\r', 't': '\t'}
+PO_SPECIALS_PATTERN = re.compile(r'[\\"\n\r\t]')
+PO_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+# Escaped ASCII content that unescapes to whitespace only (as str.strip sees it)
+PO_BLANK_PATTERN = re.compile(rb'(?:[\s\x1c-\x1f]|\\[nrt])*')
+
+# A msgid "" or msgstr "" line together with its quoted continuation lines.
+# Matches start at the newline before the keyword: a literal first character
+# lets the regex engine skip ahead to line starts instead of trying a match
+# at every position, which dominates the time for files with nothing to merge.
+# Files are matched as bytes: everything the merge looks at is ASCII, and
+# UTF-8 never uses ASCII bytes inside multi-byte characters
+PO_MULTILINE_PATTERN = re.compile(
+    rb'\n[^\S\n]*(msgid|msgstr) ""[^\n]*((?:\n[^\S\n]*"[^\n]*)*)'
+)
+
+
+def _unescape_match(match: re.Match) -> str:
+    """Replace one escape sequence, leaving unknown ones untouched."""
+    return PO_UNESCAPES.get(match.group(1), match.group(0))
 
 
 def find_po_files(directory: str) -> list:
@@ -61,10 +85,22 @@ def find_po_files(directory: str) -> list:
         List of paths to .po files
     """
     po_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.po'):
-                po_files.append(os.path.join(root, file))
+    
+    def scan(path: str) -> None:
+        # scandir entries carry their file type, so no extra stat per entry;
+        # like os.walk, skip unreadable directories and symlinked ones
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            scan(entry.path)
+                    elif entry.name.endswith('.po'):
+                        po_files.append(entry.path)
+        except OSError:
+            pass
+    
+    scan(directory)
     return sorted(po_files)
 
 
@@ -73,22 +109,19 @@ def extract_quoted_string(line: str) -> str:
     Extract string content from a quoted line in PO format.
     
     Args:
-        line: Line containing quoted string (e.g., '"text\\n"')
+        line: Stripped line containing quoted string (e.g., '"text\\n"')
         
     Returns:
         Unescaped string content
     """
-    # Remove leading/trailing whitespace and quotes
-    line = line.strip()
+    # Remove quotes; callers pass lines with whitespace already stripped
     if line.startswith('"') and line.endswith('"'):
         content = line[1:-1]
-        # Unescape common sequences (order matters - backslash first)
-        content = content.replace('\\\\', '\\')
-        content = content.replace('\\"', '"')
-        content = content.replace('\\n', '\n')
-        content = content.replace('\\r', '\r')
-        content = content.replace('\\t', '\t')
-        return content
+        # Unescape all sequences in one pass so that an escaped backslash
+        # is never read again as the start of another sequence
+        if '\\' not in content:
+            return content
+        return PO_ESCAPE_PATTERN.sub(_unescape_match, content)
     return ''
 
 
@@ -102,13 +135,25 @@ def escape_po_string(text: str) -> str:
     Returns:
         Escaped text
     """
-    # Order matters - backslash first
-    text = text.replace('\\', '\\\\')
-    text = text.replace('"', '\\"')
-    text = text.replace('\n', '\\n')
-    text = text.replace('\r', '\\r')
-    text = text.replace('\t', '\\t')
-    return text
+    # Most strings have nothing to escape
+    if not PO_SPECIALS_PATTERN.search(text):
+        return text
+    return text.translate(PO_ESCAPE_TABLE)
+
+
+def is_blank_po_string(content: bytes) -> bool:
+    """
+    Check whether escaped PO string content is empty or whitespace only.
+    
+    Args:
+        content: Escaped string content without quotes, as UTF-8 bytes
+        
+    Returns:
+        True if the unescaped content is blank
+    """
+    if not content.isascii():
+        return not extract_quoted_string(f'"{content.decode("utf-8", "replace")}"').strip()
+    return PO_BLANK_PATTERN.fullmatch(content) is not None
 
 
 def merge_po_file(file_path: str) -> bool:
@@ -121,135 +166,68 @@ def merge_po_file(file_path: str) -> bool:
     Returns:
         True if file was modified, False otherwise
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    # Same newline handling as reading in text mode
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     
-    output_lines = []
-    i = 0
-    modified = False
+    # End of the header msgid; a msgstr starting right there is the header's
+    header_end = -1
     
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    def merge_entry(match: re.Match) -> bytes:
+        nonlocal header_end
+        keyword, block = match.group(1), match.group(2)
         
-        # Check if this is a msgid "" or msgstr "" that might be multi-line
-        if stripped == 'msgid ""' or stripped.startswith('msgid ""'):
-            # Collect the msgid entry
-            msgid_lines = [line]
-            i += 1
-            
-            # Collect all continuation lines (lines starting with ")
-            msgid_content_parts = []
-            while i < len(lines) and lines[i].strip().startswith('"'):
-                msgid_lines.append(lines[i])
-                content = extract_quoted_string(lines[i])
-                msgid_content_parts.append(content)
-                i += 1
-            
-            # Check if msgid is empty (header entry) - skip processing if so
-            merged_msgid_content = ''.join(msgid_content_parts)
-            if not merged_msgid_content.strip():
-                # Empty msgid (header entry), keep as is and don't process
-                output_lines.extend(msgid_lines)
-                
-                # Also keep the msgstr as-is if it follows
-                if i < len(lines):
-                    next_line = lines[i].strip()
-                    if next_line == 'msgstr ""' or next_line.startswith('msgstr ""'):
-                        msgstr_lines = [lines[i]]
-                        i += 1
-                        while i < len(lines) and lines[i].strip().startswith('"'):
-                            msgstr_lines.append(lines[i])
-                            i += 1
-                        output_lines.extend(msgstr_lines)
-                    elif next_line.startswith('msgstr "'):
-                        # Single-line msgstr, keep as is
-                        output_lines.append(lines[i])
-                        i += 1
-                continue
-            
-            # Non-empty msgid - process and merge
-            if len(msgid_content_parts) > 0:
-                escaped_content = escape_po_string(merged_msgid_content)
-                output_lines.append(f'msgid "{escaped_content}"\n')
-                modified = True
-            else:
-                # Single line msgid "", keep as is
-                output_lines.extend(msgid_lines)
-            
-            # Now check for msgstr that follows immediately
-            if i < len(lines):
-                next_line = lines[i].strip()
-                # Check for msgstr "" with continuation lines
-                if next_line == 'msgstr ""' or next_line.startswith('msgstr ""'):
-                    # Collect the msgstr entry
-                    msgstr_lines = [lines[i]]
-                    i += 1
-                    
-                    # Collect all continuation lines
-                    msgstr_content_parts = []
-                    while i < len(lines) and lines[i].strip().startswith('"'):
-                        msgstr_lines.append(lines[i])
-                        content = extract_quoted_string(lines[i])
-                        msgstr_content_parts.append(content)
-                        i += 1
-                    
-                    # If we have multiple lines, merge them
-                    if len(msgstr_content_parts) > 0:
-                        merged_content = ''.join(msgstr_content_parts)
-                        escaped_content = escape_po_string(merged_content)
-                        output_lines.append(f'msgstr "{escaped_content}"\n')
-                        modified = True
-                    else:
-                        # Single line msgstr "", keep as is
-                        output_lines.extend(msgstr_lines)
-                    continue  # Continue only if we processed msgstr
-                # Check for single-line msgstr "..." (not starting with msgstr "")
-                elif next_line.startswith('msgstr "'):
-                    # Single-line msgstr, keep as is
-                    output_lines.append(lines[i])
-                    i += 1
-                    continue
+        if keyword == b'msgstr' and match.start() == header_end:
+            # msgstr of the header entry, keep as is
+            return match.group(0)
         
-        # Check for msgstr "" that's not immediately after msgid
-        elif stripped == 'msgstr ""' or stripped.startswith('msgstr ""'):
-            # Collect the msgstr entry
-            msgstr_lines = [line]
-            i += 1
-            
-            # Collect all continuation lines
-            msgstr_content_parts = []
-            while i < len(lines) and lines[i].strip().startswith('"'):
-                msgstr_lines.append(lines[i])
-                content = extract_quoted_string(lines[i])
-                msgstr_content_parts.append(content)
-                i += 1
-            
-            # If we have multiple lines, merge them
-            if len(msgstr_content_parts) > 0:
-                merged_content = ''.join(msgstr_content_parts)
-                escaped_content = escape_po_string(merged_content)
-                output_lines.append(f'msgstr "{escaped_content}"\n')
-                modified = True
-            else:
-                # Single line msgstr "", keep as is
-                output_lines.extend(msgstr_lines)
-            continue
+        # PO escapes never span fragments, so the escaped contents of the
+        # quoted lines can be joined without unescaping them
+        parts = []
+        for line in block.split(b'\n'):
+            line = line.strip()
+            if line:
+                parts.append(line[1:-1] if line.endswith(b'"') else b'')
+        merged_content = b''.join(parts)
         
-        # Regular line, keep as is
-        output_lines.append(line)
-        i += 1
+        if keyword == b'msgid' and is_blank_po_string(merged_content):
+            # Empty msgid (header entry), keep it and its msgstr as is
+            header_end = match.end()
+            return match.group(0)
+        
+        if not parts:
+            # Single line msgstr "", keep as is
+            return match.group(0)
+        
+        # Merged entries always end with a newline, even at the end of the file
+        end = b'' if match.end() < len(text) else b'\n'
+        return b'\n' + keyword + b' "' + merged_content + b'"' + end
+    
+    # Prefix a newline so that a keyword on the first line matches too
+    text = b'\n' + data
+    merged_data = PO_MULTILINE_PATTERN.sub(merge_entry, text)[1:]
+    modified = merged_data != data
     
     # Write back if modified
     if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(output_lines)
+        if os.linesep != '\n':
+            merged_data = merged_data.replace(b'\n', os.linesep.encode())
+        with open(file_path, 'wb') as f:
+            f.write(merged_data)
     
     return modified
 
 
 def main():
     """Main function to process all PO files."""
+    # Only the command line needs these; worker processes that import this
+    # module to run merge_po_file skip them
+    import argparse
+    from pathlib import Path
+    
     parser = argparse.ArgumentParser(
         description='Merge multi-line msgid and msgstr entries in PO files into single lines.'
     )
@@ -278,10 +256,18 @@ def main():
     
     print(f"Found {len(po_files)} PO file(s)")
     
+    # Files are independent, so merge them in worker processes; for a few
+    # files the pool startup costs more than it saves
+    if len(po_files) < 4:
+        results = [merge_po_file(po_file) for po_file in po_files]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(merge_po_file, po_files, chunksize=8))
+    
     modified_count = 0
-    for po_file in po_files:
+    for po_file, modified in zip(po_files, results):
         print(f"Processing: {po_file}")
-        if merge_po_file(po_file):
+        if modified:
             modified_count += 1
             print(f"  ✓ Modified")
         else: